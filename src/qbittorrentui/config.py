@@ -1,16 +1,115 @@
 import configparser
+import logging
+from dataclasses import dataclass, fields
 from os import path as os_path
 
+from qbittorrentui.events import settings_changed
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONFIG_FILE = os_path.join(os_path.split(__file__)[0], "default.ini")
+
+
+def is_enabled(value: str):
+    """A setting is enabled if it's set to anything other than 0 or FALSE/false/False."""
+    return bool(value and not value.upper() == "FALSE" and not value == "0")
+
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    Typed snapshot of the settings for a connection.
+
+    Settings are parsed once when the snapshot is taken so they can be read
+    as plain attributes; a new snapshot is taken (and settings_changed sent)
+    whenever the configuration changes. Each setting is named after its
+    option in lower case.
+    """
+
+    daemon_loop_interval: float
+    daemon_loop_interval_min: float
+    daemon_loop_interval_max: float
+    daemon_loop_interval_backoff: float
+    sync_torrent_max_concurrent_requests: int
+    server_preferences_ttl: float
+    commands_max_workers: int
+    http_pool_size: int
+    http_connect_timeout: float
+    http_read_timeout: float
+    http_retries: int
+    http_compression: bool
+    time_after_connection_failure_that_connection_is_considered_lost: float
+    torrent_content_max_filename_length: int
+    torrent_list_max_torrent_name_length: int
+    torrent_list_progress_bar_length: int
+    torrent_list_refresh_min_interval: float
+    torrent_list_row_cache_size: int
+    torrent_list_row_renderer: str
+    torrent_list_sort_hysteresis: float
+    torrent_peers_page_size: int
+
+    @classmethod
+    def from_config(cls, configuration, section: str = None):
+        """
+        Take a snapshot of the settings in a configuration.
+
+        :param configuration: Configuration to read the settings from
+        :param section: section to read; defaults to the default section
+        """
+        settings = {}
+        for field in fields(cls):
+            option = field.name.upper()
+            value = configuration.get(option, section=section)
+            try:
+                settings[field.name] = cls._parse(field.type, value)
+            except ValueError:
+                default_value = default_config().get("DEFAULT", option, raw=True)
+                logger.warning(
+                    "Invalid value %r for %s in section %s; using default %r",
+                    value,
+                    option,
+                    section or configuration.default_section_name,
+                    default_value,
+                )
+                settings[field.name] = cls._parse(field.type, default_value)
+        return cls(**settings)
+
+    @staticmethod
+    def _parse(type_, value: str):
+        if type_ is bool:
+            return is_enabled(value)
+        if value == "":
+            # an empty setting leaves the default to the code using it
+            return None
+        return type_(value)
+
+
+def default_config():
+    """Configuration shipped with qbittorrentui, without any user changes."""
+    default = configparser.ConfigParser()
+    default.read(DEFAULT_CONFIG_FILE)
+    return default
+
 
 class Configuration(configparser.ConfigParser):
     def __init__(self):
         super().__init__()
-        # load default configuration
-        self.read(os_path.join(os_path.split(__file__)[0], "default.ini"))
         self._section = "DEFAULT"
+        # load default configuration
+        self.read(DEFAULT_CONFIG_FILE)
+
+    @property
+    def default_section_name(self):
+        return self._section
+
+    def read(self, filenames, encoding=None):
+        read_ok = super().read(filenames, encoding=encoding)
+        self.refresh_settings()
+        return read_ok
 
     def set_default_section(self, section: str = ""):
         self._section = section
+        self.refresh_settings()
 
     def get(self, option: str, section: str = None):
         if section:
@@ -22,6 +121,11 @@ class Configuration(configparser.ConfigParser):
             super().set(section=section, option=option, value=value)
         super().set(section=self._section, option=option, value=value)
 
+    def refresh_settings(self):
+        """Take a new snapshot of the settings for the default section."""
+        self.settings = Settings.from_config(self)
+        settings_changed.send("configuration", settings=self.settings)
+
 
 # CONSTANTS
 APPLICATION_NAME = "qBittorrenTUI"
@@ -1,11 +1,17 @@
+from concurrent.futures import Future
 from enum import Enum
 from functools import wraps
 
 from qbittorrentapi import Client as qbt_Client
 from qbittorrentapi import exceptions as qbt_exceptions
+from urllib3.util.retry import Retry
 
+from qbittorrentui.config import Settings, config
 from qbittorrentui.events import run_server_command
 
+# qbittorrent-api's timeout for requests when a timeout isn't configured
+DEFAULT_HTTP_TIMEOUT = 15.1
+
 
 class ClientType(Enum):
     qbittorrent = 1
@@ -71,7 +77,16 @@ class Connector:
         username=None,
         password=None,
         verify_certificate=None,
+        config_section=None,
     ):
+        """
+        Log in to the torrent server.
+
+        HTTP transport settings are read from the configuration section for
+        the connection.
+
+        :param config_section: configuration section for the connection
+        """
         if host is None:
             host = self.host
         if port is None:
@@ -90,6 +105,7 @@ class Connector:
                     username=username,
                     password=password,
                     VERIFY_WEBUI_CERTIFICATE=verify_certificate,
+                    **self._transport_settings(config_section),
                 )
             except AssertionError:
                 raise LoginFailed("Incorrect host, username, or password")
@@ -103,6 +119,42 @@ class Connector:
                 self.is_logged_in = False
                 raise ConnectorError(repr(e))
 
+    @staticmethod
+    def _transport_settings(section: str = None):
+        """
+        Build the HTTP transport arguments for the API client.
+
+        Connections are pooled and kept alive for every daemon thread sharing
+        the client, so the pool must be at least as large as the number of
+        requests that can be in flight at once.
+
+        :param section: configuration section for the connection
+        """
+        settings = Settings.from_config(config, section=section)
+        retries = settings.http_retries
+        timeout = (
+            settings.http_connect_timeout or DEFAULT_HTTP_TIMEOUT,
+            settings.http_read_timeout or DEFAULT_HTTP_TIMEOUT,
+        )
+        return dict(
+            REQUESTS_ARGS=dict(timeout=timeout),
+            HTTPADAPTER_ARGS=dict(
+                pool_maxsize=settings.http_pool_size,
+                max_retries=Retry(
+                    total=retries,
+                    connect=retries,
+                    read=retries,
+                    status_forcelist={500, 502, 504},
+                    raise_on_status=False,
+                ),
+            ),
+            EXTRA_HEADERS={
+                "Accept-Encoding": (
+                    "gzip, deflate" if settings.http_compression else "identity"
+                )
+            },
+        )
+
     @property
     def is_connected(self):
         return self.is_logged_in
@@ -114,9 +166,13 @@ class Connector:
 
         :param func:
         :param func_args:
-        :return:
+        :return: future resolved with the server's response once the command runs
         """
-        run_server_command.send("connector", command_func=func, command_args=func_args)
+        future = Future()
+        run_server_command.send(
+            "connector", command_func=func, command_args=func_args, future=future
+        )
+        return future
 
     @connection_required
     def version(self):
@@ -177,7 +233,7 @@ class Connector:
     @connection_required
     def torrent_rename(self, new_name, torrent_id):
         if self._client_type is ClientType.qbittorrent:
-            self._send_command(
+            return self._send_command(
                 func=self._qbt_client.torrents_rename,
                 func_args=dict(new_torrent_name=new_name, hash=torrent_id),
             )
@@ -200,7 +256,7 @@ class Connector:
     @connection_required
     def torrent_file_priority(self, torrent_id, file_ids, priority):
         if self._client_type is ClientType.qbittorrent:
-            self._send_command(
+            return self._send_command(
                 func=self._qbt_client.torrents_file_priority,
                 func_args=dict(hash=torrent_id, file_ids=file_ids, priority=priority),
             )
@@ -215,7 +271,7 @@ class Connector:
     @connection_required
     def torrents_delete(self, torrent_ids, delete_files=False):
         if self._client_type is ClientType.qbittorrent:
-            self._send_command(
+            return self._send_command(
                 func=self._qbt_client.torrents_delete,
                 func_args=dict(delete_files=delete_files, hashes=torrent_ids),
             )
@@ -223,7 +279,7 @@ class Connector:
     @connection_required
     def torrents_resume(self, torrent_ids):
         if self._client_type is ClientType.qbittorrent:
-            self._send_command(
+            return self._send_command(
                 func=self._qbt_client.torrents_resume,
                 func_args=dict(hashes=torrent_ids),
             )
@@ -231,14 +287,14 @@ class Connector:
     @connection_required
     def torrents_pause(self, torrent_ids):
         if self._client_type is ClientType.qbittorrent:
-            self._send_command(
+            return self._send_command(
                 func=self._qbt_client.torrents_pause, func_args=dict(hashes=torrent_ids)
             )
 
     @connection_required
     def torrents_force_resume(self, torrent_ids):
         if self._client_type is ClientType.qbittorrent:
-            self._send_command(
+            return self._send_command(
                 func=self._qbt_client.torrents_set_force_start,
                 func_args=dict(hashes=torrent_ids, enable=True),
             )
@@ -246,7 +302,7 @@ class Connector:
     @connection_required
     def torrents_recheck(self, torrent_ids):
         if self._client_type is ClientType.qbittorrent:
-            self._send_command(
+            return self._send_command(
                 func=self._qbt_client.torrents_recheck,
                 func_args=dict(hashes=torrent_ids),
             )
@@ -254,7 +310,7 @@ class Connector:
     @connection_required
     def torrents_reannounce(self, torrent_ids):
         if self._client_type is ClientType.qbittorrent:
-            self._send_command(
+            return self._send_command(
                 func=self._qbt_client.torrents_reannounce,
                 func_args=dict(hashes=torrent_ids),
             )
@@ -267,7 +323,7 @@ class Connector:
     @connection_required
     def torrents_set_location(self, location, torrent_ids):
         if self._client_type is ClientType.qbittorrent:
-            self._send_command(
+            return self._send_command(
                 func=self._qbt_client.torrents_set_location,
                 func_args=dict(location=location, hashes=torrent_ids),
             )
@@ -275,7 +331,7 @@ class Connector:
     @connection_required
     def torrents_set_automatic_torrent_management(self, enable, torrent_ids):
         if self._client_type is ClientType.qbittorrent:
-            self._send_command(
+            return self._send_command(
                 func=self._qbt_client.torrents_set_auto_management,
                 func_args=dict(enable=enable, hashes=torrent_ids),
             )
@@ -283,7 +339,7 @@ class Connector:
     @connection_required
     def torrents_set_super_seeding(self, enable, torrent_ids):
         if self._client_type is ClientType.qbittorrent:
-            self._send_command(
+            return self._send_command(
                 func=self._qbt_client.torrents_set_super_seeding,
                 func_args=dict(enable=enable, hashes=torrent_ids),
             )
@@ -291,7 +347,7 @@ class Connector:
     @connection_required
     def torrents_set_upload_limit(self, limit, torrent_ids):
         if self._client_type is ClientType.qbittorrent:
-            self._send_command(
+            return self._send_command(
                 func=self._qbt_client.torrents_set_upload_limit,
                 func_args=dict(limit=limit, hashes=torrent_ids),
             )
@@ -299,7 +355,7 @@ class Connector:
     @connection_required
     def torrents_set_download_limit(self, limit, torrent_ids):
         if self._client_type is ClientType.qbittorrent:
-            self._send_command(
+            return self._send_command(
                 func=self._qbt_client.torrents_set_download_limit,
                 func_args=dict(limit=limit, hashes=torrent_ids),
             )
@@ -307,7 +363,7 @@ class Connector:
     @connection_required
     def torrents_set_category(self, category, torrent_ids):
         if self._client_type is ClientType.qbittorrent:
-            self._send_command(
+            return self._send_command(
                 func=self._qbt_client.torrents_set_category,
                 func_args=dict(category=category, hashes=torrent_ids),
             )
@@ -315,7 +371,7 @@ class Connector:
     @connection_required
     def torrents_set_share_limits(self, ratio_limit, seeding_time_limit, torrent_ids):
         if self._client_type is ClientType.qbittorrent:
-            self._send_command(
+            return self._send_command(
                 func=self._qbt_client.torrents_set_share_limits,
                 func_args=dict(
                     ratio_limit=ratio_limit,
@@ -3,6 +3,8 @@ import os
 import queue
 import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures.thread import _threads_queues
 from copy import deepcopy
 from time import time
 
@@ -17,6 +19,7 @@ from qbittorrentui.events import (
     server_details_changed,
     server_state_changed,
     server_torrents_changed,
+    torrent_content_stale,
     update_torrent_list_now,
     update_torrent_window_now,
     update_ui_from_daemon,
@@ -25,6 +28,22 @@ from qbittorrentui.events import (
 logger = logging.getLogger(__name__)
 
 
+def shutdown_without_waiting(executor: ThreadPoolExecutor):
+    """
+    Shut down an executor without waiting on the requests it's running.
+
+    Python joins the workers of every executor at exit; so, a request waiting
+    out its timeout would keep the application from quitting. The workers are
+    started by the daemons' threads and are daemon threads as well; so, once
+    the executor forgets them, nothing waits on them.
+
+    :param executor: executor whose work was submitted from a daemon thread
+    """
+    executor.shutdown(wait=False, cancel_futures=True)
+    for thread in list(executor._threads):
+        _threads_queues.pop(thread, None)
+
+
 class DaemonManager(threading.Thread):
     """
     Background daemon manager.
@@ -33,7 +52,7 @@ class DaemonManager(threading.Thread):
     interfaces to UI, and facilitate signaling of the UI.
 
     :param torrent_client:
-    :param daemon_signal_fd:
+    :param daemon_signal_fd: write end of the pipe used to wake up the UI
     """
 
     def __init__(self, torrent_client: Connector, daemon_signal_fd: int):
@@ -41,8 +60,10 @@ class DaemonManager(threading.Thread):
 
         self._wake_up = threading.Event()
         self._stop_request = threading.Event()
-        # use os.write to send signals back to UI
+        # signals are queued for the UI and the pipe just wakes the UI up
         self._daemon_signal_fd = daemon_signal_fd
+        self._ui_signal_q = DaemonSignalQueue(doorbell_fd=daemon_signal_fd)
+        self.get_ui_signals = self._ui_signal_q.get_all
 
         self._connection_status_q = queue.Queue()
         self._connection_status = DaemonManager.ConnectionStatus()
@@ -59,7 +80,9 @@ class DaemonManager(threading.Thread):
         self.sync_torrent_d = SyncTorrent(torrent_client)
         self.remove_sync_torrent_hash = self.sync_torrent_d.remove_sync_torrent_hash
         self.add_sync_torrent_hash = self.sync_torrent_d.add_sync_torrent_hash
+        self.set_sync_torrent_tab = self.sync_torrent_d.set_sync_torrent_tab
         self.get_torrent_store = self.sync_torrent_d.get_torrent_store
+        self.take_peer_changes = self.sync_torrent_d.take_peer_changes
 
         # Server Details
         self.server_details_d = ServerDetails(torrent_client)
@@ -69,12 +92,17 @@ class DaemonManager(threading.Thread):
         # Commands
         self.commands_d = Commands(torrent_client)
         self.run_command = self.commands_d.run_command
+        self.get_command_queue_depth = self.commands_d.get_queue_depth
+        self.get_command_stats = self.commands_d.get_command_stats
 
         ########################################
         # Signals
         ########################################
         update_torrent_list_now.connect(receiver=self.sync_maindata_d.set_wake_up)
         update_torrent_window_now.connect(receiver=self.sync_torrent_d.set_wake_up)
+        torrent_content_stale.connect(
+            receiver=self.sync_torrent_d.invalidate_torrent_content
+        )
         run_server_command.connect(receiver=self.run_command)
         update_ui_from_daemon.connect(receiver=self.signal_ui)
         connection_to_server_status.connect(
@@ -91,26 +119,8 @@ class DaemonManager(threading.Thread):
             self.commands_d,
         ]
 
-    @property
-    def signal_terminator(self):
-        return "\n"
-
-    @property
-    def signal_delimiter(self):
-        return "\t"
-
     def signal_ui(self, sender: str = "", signal: str = "", extra: list = None):
-        if extra is not None:
-            for x in extra:
-                signal = f"{signal}{self.signal_delimiter}{x}"
-        signal = f"{sender}{self.signal_delimiter}{signal}{self.signal_terminator}"
-        if isinstance(self._daemon_signal_fd, int):
-            os.write(self._daemon_signal_fd, signal.encode())
-        else:
-            raise Exception(
-                "Background daemon signal file descriptor is not valid. sender: %s"
-                % sender
-            )
+        self._ui_signal_q.put(DaemonSignal(sender=sender, signal=signal, extra=extra))
 
     def _connection_status_notification(self, sender: str = "", success: bool = False):
         self._connection_status_q.put(dict(sender=sender, success=success))
@@ -136,10 +146,9 @@ class DaemonManager(threading.Thread):
                         self._time_of_connection_failure = time()
                     else:
                         # if a connection has been lost for a little while, report it to the UI
-                        if time() - self._time_of_connection_failure > int(
-                            config.get(
-                                "TIME_AFTER_CONNECTION_FAILURE_THAT_CONNECTION_IS_CONSIDERED_LOST"
-                            )
+                        if (
+                            time() - self._time_of_connection_failure
+                            > config.settings.time_after_connection_failure_that_connection_is_considered_lost
                         ):
                             if (
                                 self._connection_status.connection_failure_reported
@@ -169,7 +178,7 @@ class DaemonManager(threading.Thread):
             except Exception:
                 pass
             finally:
-                self._wake_up.wait(timeout=int(config.get("DAEMON_LOOP_INTERVAL")))
+                self._wake_up.wait(timeout=config.settings.daemon_loop_interval)
 
         logger.info("Background manager received stop request")
 
@@ -188,6 +197,123 @@ class DaemonManager(threading.Thread):
             self.connection_failure_reported = False
 
 
+class DaemonSignal:
+    """
+    Signal from a background daemon for the UI.
+
+    :param sender: name of the daemon sending the signal
+    :param signal: name of the signal
+    :param extra: signal specific data (e.g. a torrent hash)
+    """
+
+    def __init__(self, sender: str, signal: str, extra: list = None):
+        super().__init__()
+        self.sender = sender
+        self.signal = signal
+        self.extra = tuple(extra or ())
+
+    @property
+    def key(self):
+        """Signals with the same key are duplicates of each other."""
+        return self.signal, self.extra
+
+
+class DaemonSignalQueue:
+    """
+    Thread-safe queue of signals from the background daemons for the UI.
+
+    A signal that is already waiting for the UI is moved to the back of the
+    queue instead of being queued again; so, the UI handles each signal at
+    most once each time it wakes up and still sees the signals in the order
+    they were last sent (e.g. connection lost, acquired, then lost again
+    leaves the UI disconnected). The UI is
+    woken up by writing a single byte to the doorbell pipe whenever the queue
+    goes from empty to not empty.
+
+    :param doorbell_fd: write end of the pipe watched by the UI
+    """
+
+    def __init__(self, doorbell_fd: int):
+        super().__init__()
+        self._doorbell_fd = doorbell_fd
+        # dict preserves the order signals were last queued
+        self._signals = {}
+        self._lock = threading.Lock()
+
+    def put(self, signal: DaemonSignal):
+        if not isinstance(self._doorbell_fd, int):
+            raise Exception(
+                "Background daemon signal file descriptor is not valid. sender: %s"
+                % signal.sender
+            )
+        self._lock.acquire()
+        ring_doorbell = not self._signals
+        self._signals.pop(signal.key, None)
+        self._signals[signal.key] = signal
+        self._lock.release()
+        if ring_doorbell:
+            os.write(self._doorbell_fd, b"\x00")
+
+    def get_all(self):
+        """Remove and return all the signals waiting for the UI."""
+        self._lock.acquire()
+        signals = list(self._signals.values())
+        self._signals = {}
+        self._lock.release()
+        return signals
+
+
+class PollScheduler:
+    """
+    Adaptive loop interval for a background daemon.
+
+    The interval drops to the minimum as soon as a daemon reports activity
+    and backs off towards the maximum each loop that reports nothing changed.
+    A wake up request (e.g. from the UI) also resets the interval to the
+    minimum so the next few loops stay responsive.
+
+    :param interval: starting interval in seconds
+    :param min_interval: shortest interval used while the server is busy
+    :param max_interval: ceiling for the interval while the server is idle
+    :param backoff: multiplier applied to the interval for each idle loop
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        min_interval: float = None,
+        max_interval: float = None,
+        backoff: float = 1.5,
+    ):
+        self._min_interval = min(interval, min_interval or interval)
+        self._max_interval = max(interval, max_interval or interval)
+        self._backoff = backoff
+        self._interval = interval
+
+    @classmethod
+    def from_config(cls):
+        settings = config.settings
+        return cls(
+            interval=settings.daemon_loop_interval,
+            min_interval=settings.daemon_loop_interval_min,
+            max_interval=settings.daemon_loop_interval_max,
+            backoff=settings.daemon_loop_interval_backoff,
+        )
+
+    @property
+    def interval(self):
+        return self._interval
+
+    def record_activity(self):
+        self._interval = self._min_interval
+
+    def record_idle(self):
+        self._interval = min(self._interval * self._backoff, self._max_interval)
+
+    def wake_up(self):
+        self._interval = self._min_interval
+
+
 class Daemon(threading.Thread, ABC):
     """
     Base class for background daemons to send and receive data/commands with
@@ -204,7 +330,7 @@ class Daemon(threading.Thread, ABC):
         self.wake_up = threading.Event()
         self.reset = threading.Event()
 
-        self._loop_interval = int(config.get("DAEMON_LOOP_INTERVAL"))
+        self.scheduler = self._create_scheduler()
         self._loop_success = False
 
         self.client = torrent_client
@@ -215,6 +341,10 @@ class Daemon(threading.Thread, ABC):
     def reset_daemon(self):
         pass
 
+    @staticmethod
+    def _create_scheduler():
+        return PollScheduler.from_config()
+
     @abstractmethod
     def _one_loop(self):
         pass
@@ -232,6 +362,7 @@ class Daemon(threading.Thread, ABC):
 
     def set_wake_up(self, sender):
         logging.info("Waking up %s (from %s)", self.__class__.__name__, sender)
+        self.scheduler.wake_up()
         self.wake_up.set()
 
     def run(self):
@@ -242,6 +373,8 @@ class Daemon(threading.Thread, ABC):
                 self.wake_up.clear()
                 if self.reset.is_set():
                     self.reset.clear()
+                    # connection settings may have changed the loop intervals
+                    self.scheduler = self._create_scheduler()
                     self.reset_daemon()
                 self._one_loop()
                 assert log_timing(logger, "One loop", self, "daemon loop", start_time)
@@ -258,8 +391,9 @@ class Daemon(threading.Thread, ABC):
                     self._loop_success = False
                 # wait for next loop
                 poll_time = time() - start_time
-                if poll_time < self._loop_interval:
-                    self.wake_up.wait(self._loop_interval - poll_time)
+                loop_interval = self.scheduler.interval
+                if poll_time < loop_interval:
+                    self.wake_up.wait(loop_interval - poll_time)
 
         logger.info("Daemon %s exiting", self.name)
 
@@ -283,8 +417,14 @@ class SyncMainData(Daemon):
         #  that way I don't need to directly reference this signal here
         if server_state_changed.receivers or server_torrents_changed.receivers:
             md = self.client.sync_maindata(self._rid)
-            self.maindata_q.put(SyncMainData.MainData(md))
+            maindata = SyncMainData.MainData(md)
+            self.maindata_q.put(maindata)
             self.signal_ui("sync_maindata_ready")
+            # poll faster while torrents are changing and back off while idle
+            if maindata.has_torrent_changes():
+                self.scheduler.record_activity()
+            else:
+                self.scheduler.record_idle()
             # only start incrementing once everyone is listening
             if server_state_changed.receivers and server_torrents_changed.receivers:
                 # reset syncing if '_rid' is missing from response...
@@ -311,14 +451,82 @@ class SyncMainData(Daemon):
             self.categories_removed = md.get("categories_removed", dict())
             self.categories = md.get("categories", dict())
 
+        def merge(self, md: "SyncMainData.MainData"):
+            """
+            Fold a newer delta in to this one so both apply as a single change.
+
+            :param md: MainData received after this one
+            :return: this MainData
+            """
+            if md.full_update:
+                self.full_update = True
+                self.server_state = md.server_state
+                self.torrents_removed = []
+                self.torrents = md.torrents
+                self.categories_removed = []
+                self.categories = md.categories
+                return self
+
+            self.server_state.update(md.server_state)
+
+            self.torrents_removed = list(self.torrents_removed)
+            for torrent_hash in md.torrents_removed:
+                self.torrents.pop(torrent_hash, None)
+                # a full update replaces all torrents anyway
+                if not self.full_update and torrent_hash not in self.torrents_removed:
+                    self.torrents_removed.append(torrent_hash)
+            for torrent_hash, torrent in md.torrents.items():
+                if torrent_hash in self.torrents:
+                    self.torrents[torrent_hash].update(torrent)
+                else:
+                    self.torrents[torrent_hash] = torrent
+
+            self.categories_removed = list(self.categories_removed)
+            for category_name in md.categories_removed:
+                self.categories.pop(category_name, None)
+                if (
+                    not self.full_update
+                    and category_name not in self.categories_removed
+                ):
+                    self.categories_removed.append(category_name)
+            for category_name, category in md.categories.items():
+                if category_name in self.categories:
+                    self.categories[category_name].update(category)
+                else:
+                    self.categories[category_name] = category
+
+            return self
+
+        def has_torrent_changes(self):
+            return bool(
+                self.full_update
+                or self.torrents
+                or self.torrents_removed
+                or self.categories
+                or self.categories_removed
+            )
+
 
 class SyncTorrent(Daemon):
     """
     Background daemon that syncs data for Torrent Window.
 
+    Only the data needed by the tab currently displayed in each Torrent
+    Window is requested and independent requests are sent concurrently.
+
     :param torrent_client:
     """
 
+    # data to request from the server for each tab of the Torrent Window;
+    # the torrent is always requested since its speeds decide how often to poll
+    FETCH_PLAN = {
+        "General": ("torrent", "properties"),
+        "Trackers": ("torrent", "trackers"),
+        "Peers": ("torrent", "sync_torrent_peers"),
+        "Content": ("torrent", "content"),
+    }
+    DEFAULT_TAB = "General"
+
     def __init__(self, torrent_client: Connector):
         super().__init__(torrent_client)
 
@@ -326,22 +534,60 @@ class SyncTorrent(Daemon):
         self._torrents_to_add_q = queue.Queue()
         self._torrents_to_remove_q = queue.Queue()
         self._torrent_hashes = []
+        self._torrent_tabs = {}
+        self._torrent_tabs_lock = threading.RLock()
 
         self._torrent_stores = {}
         self._torrent_store_lock = threading.RLock()
+        self._content_cache = SyncTorrent.ContentCache()
+
+        self._fetch_pool = ThreadPoolExecutor(
+            max_workers=config.settings.sync_torrent_max_concurrent_requests,
+            thread_name_prefix=self.name,
+        )
+        self._fetchers = {
+            "torrent": self._fetch_torrent,
+            "properties": self._fetch_properties,
+            "trackers": self._fetch_trackers,
+            "sync_torrent_peers": self._fetch_sync_torrent_peers,
+            "content": self._fetch_content,
+        }
 
     def _one_loop(self):
         self._update_torrent_hashes_list()
-        for torrent_hash in self._torrent_hashes:
-            self._retrieve_torrent_data(torrent_hash=torrent_hash)
-            self._send_store(torrent_hash=torrent_hash)
+        # send the requests for all torrents before waiting on any of them
+        requests = {
+            torrent_hash: self._request_torrent_data(torrent_hash=torrent_hash)
+            for torrent_hash in self._torrent_hashes
+        }
+        is_active = False
+        for torrent_hash, torrent_data in requests.items():
+            torrent_data = {
+                name: future.result() for name, future in torrent_data.items()
+            }
+            if "content" in torrent_data:
+                # None means the cached content for the torrent is still current
+                if torrent_data["content"] is None:
+                    del torrent_data["content"]
+            if self._put_torrent_store(torrent_hash=torrent_hash, **torrent_data):
+                self._send_store(torrent_hash=torrent_hash)
+            is_active = is_active or self._is_torrent_active(torrent_hash)
             self._loop_success = True
+        if is_active:
+            self.scheduler.record_activity()
+        else:
+            self.scheduler.record_idle()
 
     def reset_daemon(self):
         logger.info("%s is resetting", self.name)
         self._rid = {}
         self._torrent_hashes = []
         self._torrent_stores = {}
+        self._content_cache.clear()
+
+    def stop(self, *a):
+        super().stop(*a)
+        shutdown_without_waiting(self._fetch_pool)
 
     def add_sync_torrent_hash(self, torrent_hash: str):
         self._torrents_to_add_q.put(torrent_hash)
@@ -350,12 +596,60 @@ class SyncTorrent(Daemon):
     def remove_sync_torrent_hash(self, torrent_hash: str):
         self._torrents_to_remove_q.put(torrent_hash)
 
+    def set_sync_torrent_tab(self, torrent_hash: str, tab: str):
+        """
+        Record which tab of the Torrent Window is being displayed.
+
+        :param torrent_hash:
+        :param tab: name of the tab from SyncTorrent.FETCH_PLAN
+        """
+        self._torrent_tabs_lock.acquire()
+        self._torrent_tabs[torrent_hash] = tab
+        self._torrent_tabs_lock.release()
+        self.set_wake_up("torrent window tab changed")
+
+    def invalidate_torrent_content(self, sender, torrent_hashes: list = None):
+        """
+        Force content to be requested again for torrents changed by a command.
+
+        :param sender:
+        :param torrent_hashes:
+        """
+        for torrent_hash in torrent_hashes or []:
+            self._content_cache.invalidate(torrent_hash)
+
     def get_torrent_store(self, torrent_hash: str):
         self._torrent_store_lock.acquire()
         store = self._torrent_stores.get(torrent_hash, None)
         self._torrent_store_lock.release()
         return store
 
+    def take_peer_changes(self, torrent_hash: str):
+        """
+        Take the changes to a torrent's peers since they were last taken.
+
+        :return: changes in the form of a sync/torrentPeers response with
+            copies of the changed peers' data
+        """
+        self._torrent_store_lock.acquire()
+        store = self._torrent_stores.get(torrent_hash, None)
+        if store is None:
+            changes = None
+        else:
+            changes = dict(
+                full_update=store.peers_full_update,
+                peers={
+                    peer: dict(store.sync_torrent_peers[peer])
+                    for peer in store.peers_changed
+                },
+                peers_removed=list(store.peers_removed),
+            )
+            store.peers_full_update = False
+            store.peers_changed = set()
+            store.peers_removed = set()
+        self._torrent_store_lock.release()
+        return changes
+
     def _update_torrent_hashes_list(self):
         # remove stale torrent stores
         while not self._torrents_to_remove_q.empty():
@@ -364,6 +658,10 @@ class SyncTorrent(Daemon):
                 self._rid.pop(torrent_hash)
                 self._torrent_hashes.remove(torrent_hash)
                 self._delete_torrent_store(torrent_hash=torrent_hash)
+                self._content_cache.remove(torrent_hash)
+                self._torrent_tabs_lock.acquire()
+                self._torrent_tabs.pop(torrent_hash, None)
+                self._torrent_tabs_lock.release()
 
         # add and reset new torrents
         while not self._torrents_to_add_q.empty():
@@ -379,29 +677,75 @@ class SyncTorrent(Daemon):
                     sync_torrent_peers=dict(full_update=True),
                 )
 
-    def _retrieve_torrent_data(self, torrent_hash: str):
-        # retrieve properties, trackers, and torrent peers info for all trackers
+    def _plan_torrent_data(self, torrent_hash: str):
+        """Determine the data to request for the tab currently displayed."""
+        self._torrent_tabs_lock.acquire()
+        tab = self._torrent_tabs.get(torrent_hash, self.DEFAULT_TAB)
+        self._torrent_tabs_lock.release()
+        plan = self.FETCH_PLAN.get(tab, self.FETCH_PLAN[self.DEFAULT_TAB])
+        # peers are not synced while their tab is hidden;
+        # so, start over with a full update once it is displayed
+        store = self.get_torrent_store(torrent_hash=torrent_hash)
+        if store is not None:
+            if "sync_torrent_peers" in plan and store.tab != tab:
+                self._rid[torrent_hash] = 0
+            store.tab = tab
+        return plan
+
+    def _request_torrent_data(self, torrent_hash: str):
+        """
+        Send requests for the torrent data needed by the Torrent Window.
+
+        :param torrent_hash:
+        :return: futures for each piece of torrent data keyed by name
+        """
+        futures = {}
+        for name in self._plan_torrent_data(torrent_hash=torrent_hash):
+            if name == "content":
+                # content is only requested once the torrent shows it changed
+                futures[name] = self._fetch_pool.submit(
+                    self._fetch_content, torrent_hash, futures.get("torrent")
+                )
+            else:
+                futures[name] = self._fetch_pool.submit(
+                    self._fetchers[name], torrent_hash
+                )
+        return futures
+
+    def _fetch_torrent(self, torrent_hash: str):
         try:
-            torrent = self.client.torrents_list(torrent_ids=torrent_hash).pop()
+            return self.client.torrents_list(torrent_ids=torrent_hash).pop()
         except IndexError:
-            torrent = {}
-        properties = self.client.torrent_properties(torrent_id=torrent_hash)
-        trackers = self.client.torrent_trackers(torrent_id=torrent_hash)
+            return {}
+
+    def _fetch_properties(self, torrent_hash: str):
+        return self.client.torrent_properties(torrent_id=torrent_hash)
+
+    def _fetch_trackers(self, torrent_hash: str):
+        return self.client.torrent_trackers(torrent_id=torrent_hash)
+
+    def _fetch_sync_torrent_peers(self, torrent_hash: str):
         sync_torrent_peers = self.client.sync_torrent_peers(
             torrent_id=torrent_hash, rid=self._rid[torrent_hash]
         )
         self._rid[torrent_hash] = sync_torrent_peers.get("rid", 0)
+        return sync_torrent_peers
+
+    def _fetch_content(self, torrent_hash: str, torrent_future=None):
+        """
+        Request the torrent's content if the cached content may be stale.
+
+        :param torrent_hash:
+        :param torrent_future: pending request for the torrent (if any)
+        :return: new content or None if the cached content is current
+        """
+        torrent = torrent_future.result() if torrent_future is not None else None
+        if not self._content_cache.is_stale(torrent_hash, torrent):
+            return None
         content = self.client.torrent_files(torrent_id=torrent_hash)
-
-        # put everything in to the store for the torrent
-        self._put_torrent_store(
-            torrent_hash=torrent_hash,
-            torrent=torrent,
-            properties=properties,
-            trackers=trackers,
-            sync_torrent_peers=sync_torrent_peers,
-            content=content,
-        )
+        if not self._content_cache.put(torrent_hash, torrent, content):
+            return None
+        return content
 
     def _put_torrent_store(
         self,
@@ -412,32 +756,61 @@ class SyncTorrent(Daemon):
         sync_torrent_peers=None,
         content=None,
     ):
+        """
+        Apply new data for a torrent to its store.
+
+        :return: True if any of the data in the store changed
+        """
         self._torrent_store_lock.acquire()
         if torrent_hash not in self._torrent_stores:
             self._torrent_stores[torrent_hash] = SyncTorrent.TorrentStore()
         store = self._torrent_stores[torrent_hash]
+        changed = False
         if torrent:
+            changed = changed or torrent != store.torrent
             store.torrent = torrent
         if properties:
+            changed = changed or properties != store.properties
             store.properties = properties
         if trackers:
+            changed = changed or trackers != store.trackers
             store.trackers = trackers
         if sync_torrent_peers:
+            changed = changed or bool(
+                sync_torrent_peers.get("full_update", False)
+                or sync_torrent_peers.get("peers")
+                or sync_torrent_peers.get("peers_removed")
+            )
             if sync_torrent_peers.get("full_update", False):
                 self._torrent_stores[torrent_hash].sync_torrent_peers = (
                     sync_torrent_peers.get("peers", {})
                 )
+                store.peers_full_update = True
+                store.peers_changed = set(store.sync_torrent_peers)
+                store.peers_removed = set()
             else:
                 for peer in sync_torrent_peers.get("peers_removed", []):
                     store.sync_torrent_peers.pop(peer)
+                    store.peers_changed.discard(peer)
+                    store.peers_removed.add(peer)
                 for peer, peer_dict in sync_torrent_peers.get("peers", {}).items():
                     if peer in store.sync_torrent_peers:
                         store.sync_torrent_peers[peer].update(peer_dict)
                     else:
                         store.sync_torrent_peers[peer] = peer_dict
+                    store.peers_changed.add(peer)
+                    store.peers_removed.discard(peer)
         if content:
+            changed = True
             store.content = content
         self._torrent_store_lock.release()
+        return changed
+
+    def _is_torrent_active(self, torrent_hash: str):
+        store = self.get_torrent_store(torrent_hash=torrent_hash)
+        if store is None:
+            return False
+        return bool(store.torrent.get("dlspeed", 0) or store.torrent.get("upspeed", 0))
 
     def _send_store(self, torrent_hash: str):
         self.signal_ui("sync_torrent_data_ready", [torrent_hash])
@@ -454,13 +827,96 @@ class SyncTorrent(Daemon):
             self.properties = AttrDict()
             self.trackers = []
             self.sync_torrent_peers = AttrDict()
+            # peers changed since the changes were last taken
+            self.peers_full_update = False
+            self.peers_changed = set()
+            self.peers_removed = set()
             self.content = []
+            # tab of the Torrent Window the store was last synced for
+            self.tab = None
+
+    class ContentCache:
+        """
+        Cache of torrent content (i.e. files) keyed by torrent hash.
+
+        Content is only requested again once the torrent's progress or size
+        (which changes as files are added or deselected) changes or the cache
+        entry is invalidated. A file priority change that doesn't change the
+        torrent's size doesn't show up in the torrent's data; so, the cache
+        relies on being invalidated for those (commands that change a
+        torrent's files send torrent_content_stale).
+        """
+
+        def __init__(self):
+            super().__init__()
+            self._signatures = {}
+            self._contents = {}
+            self._lock = threading.RLock()
+
+        @staticmethod
+        def signature(torrent: dict):
+            if not torrent:
+                return None
+            return (
+                torrent.get("progress"),
+                torrent.get("completed"),
+                torrent.get("amount_left"),
+                torrent.get("size"),
+                torrent.get("total_size"),
+            )
+
+        def is_stale(self, torrent_hash: str, torrent: dict = None):
+            self._lock.acquire()
+            try:
+                if torrent_hash not in self._signatures:
+                    return True
+                signature = self.signature(torrent)
+                # without torrent info, there is no way to know if content changed
+                return signature is None or signature != self._signatures[torrent_hash]
+            finally:
+                self._lock.release()
+
+        def put(self, torrent_hash: str, torrent: dict, content: list):
+            """
+            Cache content for a torrent.
+
+            :return: True if the content differs from the cached content
+            """
+            self._lock.acquire()
+            try:
+                self._signatures[torrent_hash] = self.signature(torrent)
+                if content == self._contents.get(torrent_hash):
+                    return False
+                self._contents[torrent_hash] = content
+                return True
+            finally:
+                self._lock.release()
+
+        def invalidate(self, torrent_hash: str):
+            self._lock.acquire()
+            self._signatures.pop(torrent_hash, None)
+            self._lock.release()
+
+        def remove(self, torrent_hash: str):
+            self._lock.acquire()
+            self._signatures.pop(torrent_hash, None)
+            self._contents.pop(torrent_hash, None)
+            self._lock.release()
+
+        def clear(self):
+            self._lock.acquire()
+            self._signatures = {}
+            self._contents = {}
+            self._lock.release()
 
 
 class ServerDetails(Daemon):
     """
     Background daemon that syncs server details with app.
 
+    The server version is only requested once per connection and preferences
+    are cached for SERVER_PREFERENCES_TTL seconds.
+
     :param torrent_client:
     """
 
@@ -472,29 +928,49 @@ class ServerDetails(Daemon):
         self._server_details_lock = threading.RLock()
         self._server_preferences_lock = threading.RLock()
 
-    def _one_loop(self):
-        server_version = self.client.version()
-        preferences = self.client.preferences()
-
-        self.set_preferences(preferences)
+        self._is_server_version_stale = True
+        self._is_server_details_sent = False
+        self._preferences_expiration = 0
 
-        new_details = False
-        if server_details_changed.receivers:
-            if server_version != self.get_server_details("server_version"):
-                self.set_server_detail("server_version", server_version)
-                new_details = True
+    def _one_loop(self):
+        try:
+            if self._is_server_version_stale:
+                self.set_server_detail("server_version", self.client.version())
+                self._is_server_version_stale = False
+                self._is_server_details_sent = False
+                self._loop_success = True
+
+            if time() >= self._preferences_expiration:
+                self.set_preferences(self.client.preferences())
+                self._preferences_expiration = (
+                    time() + config.settings.server_preferences_ttl
+                )
+                self._loop_success = True
+        except ConnectorError:
+            # the server may have been upgraded by the time it is reachable again
+            self._is_server_version_stale = True
+            raise
 
-        if new_details:
+        if not self._is_server_details_sent and server_details_changed.receivers:
             self.signal_ui("server_details_ready")
-
-        self._loop_success = True
+            self._is_server_details_sent = True
+            self.scheduler.record_activity()
+        else:
+            self.scheduler.record_idle()
 
     def reset_daemon(self):
         logger.info("%s is resetting", self.name)
+        self._is_server_version_stale = True
+        self._preferences_expiration = 0
 
     def get_server_preferences(self):
+        """
+        Cached server preferences.
+
+        The same snapshot is returned to every caller; so, it must not be modified.
+        """
         self._server_preferences_lock.acquire()
-        prefs = deepcopy(self._server_preferences)
+        prefs = self._server_preferences
         self._server_preferences_lock.release()
         return prefs
 
@@ -518,49 +994,416 @@ class ServerDetails(Daemon):
             return details.get(detail, "")
 
 
-# TODO: implement callback ability
 class Commands(Daemon):
     """
     Daemon to send commands to the server.
 
+    Commands run concurrently on a bounded pool of workers; however, commands
+    for the same torrent always run one at a time in the order they were sent.
+    The future sent with a command is resolved once the server responds.
+
     :param torrent_client:
     """
 
     def __init__(self, torrent_client: Connector):
         super().__init__(torrent_client)
 
-        # set a long loop interval since anything sending
-        # commands should also be setting the wake alarm
-        self._loop_interval = 60
-
         self._command_q = queue.Queue()
+        # commands waiting on an earlier command for the same torrent
+        self._pending_commands = []
+
+        # ordering keys of the commands currently running
+        self._running_keys = {}
+        self._running_count = 0
+        self._running_lock = threading.RLock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=config.settings.commands_max_workers,
+            thread_name_prefix=self.name,
+        )
+
+        self._command_stats = {}
+        self._command_stats_lock = threading.RLock()
 
     def _one_loop(self):
-        # logger.info("Command queue length: %s", self._command_q.qsize())
-        ran_commands = False
         while not self._command_q.empty():
-            try:
-                command = self._command_q.get()
-                command_func = command.get("func", "")
-                command_args = command.get("func_args", dict())
-                logger.info("Background command: %s", command_func)
-                logger.info("Background command args: %s ", command_args)
-                command_func(**command_args)
-                ran_commands = True
-            except ConnectorError:
-                raise
-            except Exception:
-                logger.info("Failed to run command", exc_info=True)
+            self._pending_commands.append(self._command_q.get())
+        self._pending_commands = self.coalesce(self._pending_commands)
+
+        # start every command that isn't waiting on an earlier command
+        waiting_commands = []
+        self._running_lock.acquire()
+        blocked_keys = set(self._running_keys)
+        for command in self._pending_commands:
+            if command.is_blocked_by(blocked_keys):
+                waiting_commands.append(command)
+                # torrents in a batch that aren't waiting on anything can run now
+                ready_command = command.split_off(blocked_keys)
+            else:
+                ready_command = command
+            if ready_command is not None:
+                for key in ready_command.ordering_keys:
+                    self._running_keys[key] = self._running_keys.get(key, 0) + 1
+                self._running_count += 1
+                self._submit(ready_command)
+                blocked_keys.update(ready_command.ordering_keys)
+            blocked_keys.update(command.ordering_keys)
+        self._running_lock.release()
+        self._pending_commands = waiting_commands
+
+    def _submit(self, command: "Commands.Command"):
+        run_future = self._executor.submit(self._run_command, command)
+        # commands dropped when the daemon stops will never run
+        run_future.add_done_callback(
+            lambda f: command.cancel() if f.cancelled() else None
+        )
 
-        # request server sync if commands were issued
-        if ran_commands:
+    def _run_command(self, command: "Commands.Command"):
+        start_time = time()
+        success = False
+        result = error = None
+        try:
+            logger.info("Background command: %s", command.func)
+            logger.info("Background command args: %s ", command.func_args)
+            result = command.func(**command.func_args)
+            success = True
             self._loop_success = True
+        except ConnectorError as e:
+            logger.info("Daemon %s could not connect to server", self.name)
+            connection_to_server_status.send(self.name, success=False)
+            error = e
+        except Exception as e:
+            logger.info("Failed to run command", exc_info=True)
+            error = e
+        finally:
+            self._record_command_stats(command, success, start_time)
+            self._running_lock.acquire()
+            for key in command.ordering_keys:
+                self._running_keys[key] -= 1
+                if self._running_keys[key] == 0:
+                    del self._running_keys[key]
+            self._running_count -= 1
+            self._running_lock.release()
+            # start any commands that were waiting on this one
+            self.set_wake_up("command completed")
+
+        # request server sync since the command was issued
+        if success:
+            if command.changes_content:
+                torrent_content_stale.send(
+                    "%s daemon" % self.name,
+                    torrent_hashes=list(command.torrent_hashes),
+                )
             update_torrent_list_now.send("%s daemon" % self.name)
             update_torrent_window_now.send("%s daemon" % self.name)
+            command.set_result(result)
+        else:
+            command.set_exception(error)
+
+    def _record_command_stats(
+        self, command: "Commands.Command", success: bool, start_time: float
+    ):
+        end_time = time()
+        latency = end_time - command.queued_time
+        logger.info(
+            "Background command %s %s in %.2fs (%.2fs running)",
+            command.name,
+            "completed" if success else "failed",
+            latency,
+            end_time - start_time,
+        )
+        self._command_stats_lock.acquire()
+        stats = self._command_stats.setdefault(
+            command.name,
+            AttrDict(count=0, failures=0, total_latency=0.0, max_latency=0.0),
+        )
+        stats.count += 1
+        stats.failures += 0 if success else 1
+        stats.total_latency += latency
+        stats.max_latency = max(stats.max_latency, latency)
+        self._command_stats_lock.release()
+
+    def get_command_stats(self):
+        """
+        Statistics for each type of command run so far.
+
+        Latency is measured from when the command was sent to the daemon
+        until the server responded.
+        """
+        self._command_stats_lock.acquire()
+        stats = {
+            name: AttrDict(
+                count=s.count,
+                failures=s.failures,
+                avg_latency=s.total_latency / s.count,
+                max_latency=s.max_latency,
+            )
+            for name, s in self._command_stats.items()
+        }
+        self._command_stats_lock.release()
+        return stats
+
+    def get_queue_depth(self):
+        """Number of commands that haven't finished running."""
+        return AttrDict(
+            queued=self._command_q.qsize(),
+            waiting=len(self._pending_commands),
+            running=self._running_count,
+        )
 
     def reset_daemon(self):
         logger.info("%s is resetting", self.name)
 
-    def run_command(self, sender: str, command_func: str, command_args: dict):
-        self._command_q.put(dict(func=command_func, func_args=command_args))
+    def stop(self, *a):
+        super().stop(*a)
+        shutdown_without_waiting(self._executor)
+
+    def run(self):
+        super().run()
+        # commands still waiting when the daemon stops will never run
+        while not self._command_q.empty():
+            self._pending_commands.append(self._command_q.get())
+        for command in self._pending_commands:
+            command.cancel()
+        self._pending_commands = []
+
+    @staticmethod
+    def coalesce(commands: list):
+        """
+        Merge commands in to as few requests to the server as possible.
+
+        A command is merged in to an earlier command for the same function
+        with the same arguments (other than torrent hashes) unless a command
+        in between also applies to one of its torrents; this way, commands
+        for any one torrent still run in the order they were sent. Exact
+        duplicates are dropped the same way.
+
+        :param commands: commands in the order they were sent
+        :return: commands to run
+        """
+        coalesced = []
+        for command in commands:
+            for prior_command in reversed(coalesced):
+                if prior_command.absorb(command):
+                    break
+                if prior_command.conflicts_with(command):
+                    coalesced.append(command)
+                    break
+            else:
+                coalesced.append(command)
+        return coalesced
+
+    @staticmethod
+    def _create_scheduler():
+        # set a long loop interval since anything sending
+        # commands should also be setting the wake alarm
+        return PollScheduler(interval=60)
+
+    def run_command(
+        self,
+        sender: str,
+        command_func: str,
+        command_args: dict,
+        future: Future = None,
+    ):
+        self._command_q.put(
+            Commands.Command(func=command_func, func_args=command_args, future=future)
+        )
         self.set_wake_up(sender)
+
+    class Command:
+        """
+        Command to send to the server.
+
+        :param func: API function to call
+        :param func_args: keyword arguments for func
+        :param future: future to resolve with the response from the server
+        """
+
+        ALL_TORRENTS = "all"
+        # API functions that can change a torrent's files or their priorities
+        CONTENT_COMMANDS = frozenset(
+            {
+                "torrents_file_priority",
+                "torrents_rename_file",
+                "torrents_rename_folder",
+                "torrents_set_location",
+                "torrents_set_save_path",
+                "torrents_set_download_path",
+                "torrents_recheck",
+            }
+        )
+
+        def __init__(self, func, func_args: dict, future: Future = None):
+            super().__init__()
+            self.func = func
+            self.func_args = dict(func_args)
+            self.name = getattr(func, "__name__", str(func))
+            self.queued_time = time()
+
+            hashes = self.func_args.get("hashes", self.func_args.get("hash"))
+            if not hashes:
+                hashes = []
+            elif isinstance(hashes, str):
+                hashes = hashes.split("|")
+            # dict to de-duplicate while preserving order
+            self._torrent_hashes = dict.fromkeys(hashes)
+
+            # futures of everyone waiting on the command and their torrents
+            self._futures = []
+            if future is not None:
+                self._futures.append((future, frozenset(self._torrent_hashes)))
+
+        @property
+        def torrent_hashes(self):
+            return self._torrent_hashes.keys()
+
+        @property
+        def changes_content(self):
+            """Whether the command may change the content of its torrents."""
+            return self.name in self.CONTENT_COMMANDS and bool(self._torrent_hashes)
+
+        @property
+        def ordering_keys(self):
+            """
+            Commands sharing a key must run in the order they were sent.
+
+            Commands that don't apply to torrents are ordered with other
+            commands for the same function.
+            """
+            if self._torrent_hashes:
+                return set(self._torrent_hashes)
+            return {self.name}
+
+        def is_blocked_by(self, keys: set):
+            """Whether the command must wait on commands with these keys."""
+            if not self._torrent_hashes:
+                return self.name in keys
+            if self.ALL_TORRENTS in self._torrent_hashes:
+                return bool(keys)
+            return self.ALL_TORRENTS in keys or not keys.isdisjoint(
+                self._torrent_hashes
+            )
+
+        @property
+        def is_batchable(self):
+            """Whether the command accepts any number of torrents in 'hashes'."""
+            return (
+                "hashes" in self.func_args
+                and self.ALL_TORRENTS not in self._torrent_hashes
+            )
+
+        def split_off(self, keys: set):
+            """
+            Remove the torrents not in keys from a batched command.
+
+            :return: new command for the removed torrents or None
+            """
+            # nothing can overtake a command that is waiting on every torrent
+            if not self.is_batchable or self.ALL_TORRENTS in keys:
+                return None
+            free_hashes = [h for h in self._torrent_hashes if h not in keys]
+            if not free_hashes or len(free_hashes) == len(self._torrent_hashes):
+                return None
+            for torrent_hash in free_hashes:
+                del self._torrent_hashes[torrent_hash]
+            self.func_args["hashes"] = "|".join(self._torrent_hashes)
+            command = Commands.Command(
+                func=self.func,
+                func_args=dict(self.func_args, hashes="|".join(free_hashes)),
+            )
+            command.queued_time = self.queued_time
+
+            # hand over the futures for the removed torrents; anyone waiting
+            # on torrents in both commands waits on both of them
+            free_hashes = frozenset(free_hashes)
+            futures = self._futures
+            self._futures = []
+            for future, hashes in futures:
+                if hashes <= free_hashes:
+                    command._futures.append((future, hashes))
+                elif hashes.isdisjoint(free_hashes):
+                    self._futures.append((future, hashes))
+                else:
+                    free_half, kept_half = self._split_future(future)
+                    command._futures.append((free_half, hashes & free_hashes))
+                    self._futures.append((kept_half, hashes - free_hashes))
+            return command
+
+        @staticmethod
+        def _split_future(future: Future):
+            """
+            Create two futures that resolve the given future once both are done.
+
+            The given future takes the first error from either half or else
+            the result of the last half to finish.
+            """
+            halves = (Future(), Future())
+            lock = threading.Lock()
+
+            def half_done(_):
+                lock.acquire()
+                try:
+                    if future.done() or not all(h.done() for h in halves):
+                        return
+                    if any(h.cancelled() for h in halves):
+                        future.cancel()
+                    elif future.set_running_or_notify_cancel():
+                        errors = [h.exception() for h in halves if h.exception()]
+                        if errors:
+                            future.set_exception(errors[0])
+                        else:
+                            future.set_result(halves[-1].result())
+                finally:
+                    lock.release()
+
+            for half in halves:
+                half.add_done_callback(half_done)
+            return halves
+
+        def set_result(self, result):
+            """Resolve the futures waiting on the command with its response."""
+            for future, _ in self._futures:
+                if future.set_running_or_notify_cancel():
+                    future.set_result(result)
+
+        def set_exception(self, exception: Exception):
+            """Resolve the futures waiting on the command with its error."""
+            for future, _ in self._futures:
+                if future.set_running_or_notify_cancel():
+                    future.set_exception(exception)
+
+        def cancel(self):
+            """Cancel the futures waiting on a command that will never run."""
+            for future, _ in self._futures:
+                future.cancel()
+
+        def _other_args(self):
+            return {k: v for k, v in self.func_args.items() if k != "hashes"}
+
+        def conflicts_with(self, command: "Commands.Command"):
+            """Whether the commands must run in the order they were sent."""
+            if self.ALL_TORRENTS in self._torrent_hashes and command.torrent_hashes:
+                return True
+            if self.ALL_TORRENTS in command._torrent_hashes and self.torrent_hashes:
+                return True
+            return not self.torrent_hashes.isdisjoint(command.torrent_hashes)
+
+        def absorb(self, command: "Commands.Command"):
+            """
+            Merge another command in to this one if possible.
+
+            :return: True if the command no longer needs to be run
+            """
+            if self.func != command.func:
+                return False
+            if self.func_args == command.func_args:
+                self._futures.extend(command._futures)
+                return True
+            if not (self.is_batchable and command.is_batchable):
+                return False
+            if self._other_args() != command._other_args():
+                return False
+            self._torrent_hashes.update(command._torrent_hashes)
+            self.func_args["hashes"] = "|".join(self._torrent_hashes)
+            self._futures.extend(command._futures)
+            return True
@@ -1,5 +1,8 @@
 import blinker
 
+# signal that the settings changed (e.g. a connection's settings were selected)
+settings_changed = blinker.Signal()
+
 # signal from a background daemon for the ui
 update_ui_from_daemon = blinker.Signal()
 
@@ -33,6 +36,9 @@ update_torrent_window_now = blinker.Signal()
 # signal for background poller to send commands to server
 run_server_command = blinker.Signal()
 
+# signal that a command may have changed the content (i.e. files) of torrents
+torrent_content_stale = blinker.Signal()
+
 # once torrent client is connected, signal to reset the torrent list
 initialize_torrent_list = blinker.Signal()
 
@@ -1,21 +1,61 @@
+from functools import lru_cache
+
+from qbittorrentui.config import INFINITY, SECS_INFINITY
+
+# units of time for durations, largest first
+TIME_UNITS = ((86400, "d"), (3600, "h"), (60, "m"))
+
+SIZE_SUFFIXES = {
+    "decimal": ("kB", "MB", "GB", "TB", "PB", "EB", "ZB", "YB"),
+    "binary": ("KiB", "MiB", "GiB", "TiB", "PiB", "EiB", "ZiB", "YiB"),
+    "gnu": "KMGTPEZY",
+}
+
+
+# each file size unit is the size that is too large for the unit before it
+SIZE_UNITS = {
+    name: tuple(
+        (base ** (i + 2), suffix) for i, suffix in enumerate(SIZE_SUFFIXES[name])
+    )
+    for name, base in (("decimal", 1000), ("binary", 1024), ("gnu", 1024))
+}
+
+
 def pretty_time_delta(seconds, spaces=False):
-    seconds = int(seconds)
+    return _pretty_time_delta(int(seconds), spaces is not False)
+
+
+@lru_cache(maxsize=4096)
+def _pretty_time_delta(seconds: int, spaces: bool):
     days, seconds = divmod(seconds, 86400)
     hours, seconds = divmod(seconds, 3600)
     minutes, seconds = divmod(seconds, 60)
+    separator = " " if spaces else ""
     if days > 0:
-        # return '%dd%dh%dm%ds' % (days, hours, minutes, seconds)
-        ret = "%dd %dh" % (days, hours)
-    elif hours > 0:
-        # return '%dh%dm%ds' % (hours, minutes, seconds)
-        ret = "%dh %dm" % (hours, minutes)
-    elif minutes > 0:
-        ret = "%dm %ds" % (minutes, seconds)
+        return f"{days}d{separator}{hours}h"
+    if hours > 0:
+        return f"{hours}h{separator}{minutes}m"
+    if minutes > 0:
+        return f"{minutes}m{separator}{seconds}s"
+    return f"{seconds}s"
+
+
+@lru_cache(maxsize=4096)
+def format_eta(seconds):
+    """Format an ETA with just the largest unit of time (eg. ETA  3h)."""
+    if seconds >= SECS_INFINITY:
+        eta = INFINITY
     else:
-        ret = "%ds" % seconds
-    if spaces is False:
-        return ret.replace(" ", "")
-    return ret
+        eta = None
+        # same as the first unit of pretty_time_delta()
+        seconds = int(seconds) % 86400 if seconds < 0 else int(seconds)
+        for unit_seconds, unit in TIME_UNITS:
+            if seconds >= unit_seconds:
+                eta = f"{seconds // unit_seconds}{unit}"
+                break
+        if eta is None:
+            eta = f"{seconds}s"
+    return f"ETA {eta.rjust(3)}"[:7]
 
 
 def natural_file_size(value, binary=False, gnu=False, num_format="%.1f"):
@@ -30,17 +70,28 @@ def natural_file_size(value, binary=False, gnu=False, num_format="%.1f"):
     Non-gnu modes are compatible with jinja2's ``filesizeformat`` filter.
     source: https://github.com/luckydonald-forks/humanize/blob/master/humanize/filesize.py
     """
-    suffixes = {
-        "decimal": ("kB", "MB", "GB", "TB", "PB", "EB", "ZB", "YB"),
-        "binary": ("KiB", "MiB", "GiB", "TiB", "PiB", "EiB", "ZiB", "YiB"),
-        "gnu": "KMGTPEZY",
-    }
+    return _natural_file_size(value, bool(binary), bool(gnu), num_format)
+
+
+def natural_file_sizes(values, binary=False, gnu=False, num_format="%.1f"):
+    """
+    Format a column of numbers of bytes like natural_file_size().
+
+    :param values: iterable of numbers of bytes
+    :return: list of the formatted sizes
+    """
+    binary, gnu = bool(binary), bool(gnu)
+    return [_natural_file_size(v, binary, gnu, num_format) for v in values]
+
+
+@lru_cache(maxsize=8192)
+def _natural_file_size(value, binary: bool, gnu: bool, num_format: str):
     if gnu:
-        suffix = suffixes["gnu"]
+        units = SIZE_UNITS["gnu"]
     elif binary:
-        suffix = suffixes["binary"]
+        units = SIZE_UNITS["binary"]
     else:
-        suffix = suffixes["decimal"]
+        units = SIZE_UNITS["decimal"]
 
     base = 1024 if (gnu or binary) else 1000
     num_of_bytes = float(value)
@@ -48,24 +99,18 @@ def natural_file_size(value, binary=False, gnu=False, num_format="%.1f"):
     if num_of_bytes == 1 and not gnu:
         return "1 B"
 
-    if num_of_bytes < base and not gnu:
-        if num_of_bytes > 1000:
-            num_of_bytes = base
-        else:
-            return "%d B" % num_of_bytes
-    elif num_of_bytes < base and gnu:
+    if num_of_bytes < base:
         if num_of_bytes > 1000:
             num_of_bytes = base
         else:
-            return "%dB" % num_of_bytes
+            return ("%dB" if gnu else "%d B") % num_of_bytes
 
-    for i, s in enumerate(suffix):
-        unit = base ** (i + 2)
+    for unit, suffix in units:
         # round up to next unit to avoid 4 digit size
-        if len(str(int(base * num_of_bytes / unit))) == 4 and num_of_bytes < unit:
+        if num_of_bytes < unit and base * num_of_bytes / unit >= 1000:
             num_of_bytes = unit
         if num_of_bytes < unit:
             break
     if gnu:
-        return (num_format + "%s") % ((base * num_of_bytes / unit), s)
-    return (num_format + " %s") % ((base * num_of_bytes / unit), s)
+        return (num_format + "%s") % ((base * num_of_bytes / unit), suffix)
+    return (num_format + " %s") % ((base * num_of_bytes / unit), suffix)
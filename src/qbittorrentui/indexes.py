@@ -0,0 +1,137 @@
+from collections import Counter
+
+
+class MaxMultiset:
+    """
+    Multiset of values that tracks its largest value.
+
+    Values are added and removed as the data they come from changes so the
+    largest value never requires a pass over all of the data.
+    """
+
+    def __init__(self, values=()):
+        self._counts = Counter(values)
+        self._max = max(self._counts, default=None)
+
+    def add(self, value):
+        self._counts[value] += 1
+        if self._max is None or value > self._max:
+            self._max = value
+
+    def remove(self, value):
+        count = self._counts.get(value, 0)
+        if count <= 1:
+            self._counts.pop(value, None)
+            if value == self._max:
+                # only distinct values are scanned
+                self._max = max(self._counts, default=None)
+        else:
+            self._counts[value] = count - 1
+
+    def replace(self, old_value, new_value):
+        if old_value != new_value:
+            self.add(new_value)
+            self.remove(old_value)
+
+    def clear(self):
+        self._counts.clear()
+        self._max = None
+
+    def max(self, default=None):
+        return self._max if self._max is not None else default
+
+
+class TextSearch:
+    """
+    Case-insensitive substring search over text that changes over time.
+
+    This is a scan of all the text with narrowing rather than an index: a
+    new query scans every text unless it contains the previous query, in
+    which case only the previous matches are scanned. The matches for the
+    current query are kept up to date as text is set and removed so they
+    never need to be searched for again.
+    """
+
+    def __init__(self):
+        self._texts = {}
+        self.query = ""
+        self.matches = set()
+
+    def __contains__(self, key):
+        """Whether the text for key matches the query."""
+        return not self.query or key in self.matches
+
+    def set(self, key, text: str):
+        text = text.casefold()
+        self._texts[key] = text
+        if self.query:
+            if self.query in text:
+                self.matches.add(key)
+            else:
+                self.matches.discard(key)
+
+    def remove(self, key):
+        self._texts.pop(key, None)
+        self.matches.discard(key)
+
+    def clear(self):
+        self._texts.clear()
+        self.matches.clear()
+
+    def search(self, query: str):
+        """
+        Search for a new query.
+
+        :return: keys whose text contains the query
+        """
+        query = query.casefold()
+        if self.query and self.query in query:
+            candidates = self.matches
+        else:
+            candidates = self._texts
+        self.query = query
+        if query:
+            self.matches = {key for key in candidates if query in self._texts[key]}
+        else:
+            self.matches = set()
+        return self.matches
+
+
+class FacetIndex:
+    """
+    Index of the keys with each value of a facet (e.g. torrents by category).
+
+    Each key may have any number of values; membership is only changed for
+    the values a key gains or loses.
+    """
+
+    def __init__(self):
+        self._members = {}
+        self._values = {}
+
+    def set(self, key, values):
+        values = frozenset(values)
+        old_values = self._values.get(key, frozenset())
+        for value in old_values - values:
+            members = self._members[value]
+            members.discard(key)
+            if not members:
+                del self._members[value]
+        for value in values - old_values:
+            self._members.setdefault(value, set()).add(key)
+        self._values[key] = values
+
+    def remove(self, key):
+        self.set(key, ())
+        del self._values[key]
+
+    def clear(self):
+        self._members.clear()
+        self._values.clear()
+
+    def members(self, value):
+        return self._members.get(value, frozenset())
+
+    def counts(self):
+        """Number of keys with each value."""
+        return {value: len(members) for value, members in self._members.items()}
@@ -41,61 +41,39 @@ class TorrentServer:
         self.daemon = daemon
         self.server_state = {}
         self.categories = {}
-        self.partial_daemon_signal = ""
-
-    def daemon_signal(self, signal):
-        signal_str = signal.decode()
-        # it's technically possible for the daemon to send multiple signals before
-        # the urwid event loop reads from the buffer. (this is most obvious if you set a
-        # breakpoint pausing the urwid loop.) therefore, signals can all be read together.
-        # this looping will allow each signal to still be processed as intended.
-        # additionally, if the buffer grows too large, the urwid documentation suggests
-        # only some of the buffer will be read in. so, if the signal string doesn't end
-        # in the daemon signal terminator, save off the end of the signal for the next loop.
-        if signal_str:
-            signal_list = signal_str.split(self.daemon.signal_terminator)
-            if signal_str.endswith(self.daemon.signal_terminator):
-                # if the signal list terminates as expected, prepend any partial signal
-                # to the first signal and process the signals
-                signal_list[0] = self.partial_daemon_signal + signal_list[0]
-                self.partial_daemon_signal = ""
-                # remove the last element since it'll just be an empty string
-                signal_list.pop(-1)
+
+    def daemon_signal(self, _):
+        """
+        Process the signals queued by the background daemon.
+
+        The data read from the pipe only exists to wake up the urwid loop;
+        the signals themselves are retrieved from the daemon's signal queue.
+        """
+        for daemon_signal in self.daemon.get_ui_signals():
+            sender = daemon_signal.sender
+            signal = daemon_signal.signal
+            extra = daemon_signal.extra
+            if signal == "sync_maindata_ready":
+                self.update_sync_maindata()
+            elif signal == "server_details_ready":
+                self.update_details()
+            elif signal == "sync_torrent_data_ready":
+                self.update_sync_torrents(torrent_hash=extra[0])
+            elif signal == "connection_lost":
+                connection_to_server_lost.send(sender)
+            elif signal == "connection_acquired":
+                connection_to_server_acquired.send(sender)
+            elif signal == "close_pipe":
+                # tell urwid loop to close the read end of the pipe...
+                # daemon will close write end
+                return False
             else:
-                # if the last signal doesnt end with the terminator, remove it from the
-                # signal list to be processed and concatenate to any previous partial signal
-                # saving the whole thing as the new partial signal.
-                # if the whole new signal string was a new partial, then nothing will be
-                # processed for this signal event.
-                self.partial_daemon_signal = (
-                    self.partial_daemon_signal + signal_list.pop(-1)
+                logger.info(
+                    "Received unknown signal from daemon: sender: %s signal: %s",
+                    sender,
+                    signal,
+                    exc_info=True,
                 )
-            for one_signal in signal_list:
-                signal_parts = one_signal.split(self.daemon.signal_delimiter)
-                sender = signal_parts[0]
-                signal = signal_parts[1]
-                extra = list(signal_parts[2:])
-                if signal == "sync_maindata_ready":
-                    self.update_sync_maindata()
-                elif signal == "server_details_ready":
-                    self.update_details()
-                elif signal == "sync_torrent_data_ready":
-                    self.update_sync_torrents(torrent_hash=extra[0])
-                elif signal == "connection_lost":
-                    connection_to_server_lost.send(sender)
-                elif signal == "connection_acquired":
-                    connection_to_server_acquired.send(sender)
-                elif signal == "close_pipe":
-                    # tell urwid loop to close the read end of the pipe...
-                    # daemon will close write end
-                    return False
-                else:
-                    logger.info(
-                        "Received unknown signal from daemon: sender: %s signal: %s",
-                        sender,
-                        signal,
-                        exc_info=True,
-                    )
         return True
 
     def update_details(self):
@@ -113,41 +91,46 @@ class TorrentServer:
         server_torrents_updated = False
 
         # flush the queue if it backs up for any reason...
+        # merging everything queued in to one change for the UI
+        md = None
         while not self.daemon.sync_maindata_q.empty():
-            md = self.daemon.sync_maindata_q.get()
-
-            if md.full_update:
-                self.server_state = md.server_state
+            queued_md = self.daemon.sync_maindata_q.get()
+            md = queued_md if md is None else md.merge(queued_md)
+        if md is None:
+            return
+
+        if md.full_update:
+            self.server_state = md.server_state
+            server_details_updated = True
+            server_torrents_updated = True
+            self.categories = md.categories
+
+        else:
+            if md.server_state:
+                self.server_state.update(md.server_state)
                 server_details_updated = True
+
+            # if torrents removed or updated, send the updates
+            if md.torrents_removed or md.torrents:
                 server_torrents_updated = True
-                self.categories = md.categories
 
-            else:
-                if md.server_state:
-                    self.server_state.update(md.server_state)
-                    server_details_updated = True
-
-                # if torrents removed or updated, send the updates
-                if md.torrents_removed or md.torrents:
-                    server_torrents_updated = True
-
-                # remove categories no longer in qbittorrent
-                for category in md.categories_removed:
-                    self.categories.pop(category, None)
-                # add new categories or new category info
-                for category_name, category in md.categories.items():
-                    if category_name in self.categories:
-                        self.categories[category_name].update(category)
-                    else:
-                        self.categories[category_name] = category
-
-            if server_torrents_updated:
-                server_torrents_changed.send(
-                    "maindata update",
-                    full_update=md.full_update,
-                    torrents=md.torrents,
-                    torrents_removed=md.torrents_removed,
-                )
+            # remove categories no longer in qbittorrent
+            for category in md.categories_removed:
+                self.categories.pop(category, None)
+            # add new categories or new category info
+            for category_name, category in md.categories.items():
+                if category_name in self.categories:
+                    self.categories[category_name].update(category)
+                else:
+                    self.categories[category_name] = category
+
+        if server_torrents_updated:
+            server_torrents_changed.send(
+                "maindata update",
+                full_update=md.full_update,
+                torrents=md.torrents,
+                torrents_removed=md.torrents_removed,
+            )
 
         if server_details_updated:
             server_state_changed.send("maindata update", server_state=self.server_state)
@@ -160,7 +143,7 @@ class TorrentServer:
                 torrent=store.torrent,
                 properties=store.properties,
                 trackers=store.trackers,
-                sync_torrent_peers=store.sync_torrent_peers,
+                sync_torrent_peers=self.daemon.take_peer_changes(torrent_hash),
                 content=store.content,
             )
 
@@ -3,7 +3,13 @@ from time import time
 
 import urwid as uw
 
-from qbittorrentui.config import APPLICATION_NAME, DOWN_TRIANGLE, UP_TRIANGLE, config
+from qbittorrentui.config import (
+    APPLICATION_NAME,
+    DOWN_TRIANGLE,
+    UP_TRIANGLE,
+    config,
+    is_enabled,
+)
 from qbittorrentui.connector import ConnectorError, LoginFailed
 from qbittorrentui.debug import log_keypress, log_timing
 from qbittorrentui.events import (
@@ -38,6 +44,8 @@ class AppWindow(uw.Frame):
 
     def keypress(self, size, key):
         log_keypress(logger, self, key)
+        # let the body have the key first so typing in to it isn't interrupted
+        key = super().keypress(size, key)
         if key in ["n", "N"]:
             self.main.loop.widget = uw.Overlay(
                 top_w=uw.LineBox(ConnectDialog(self.main)),
@@ -47,7 +55,7 @@ class AppWindow(uw.Frame):
                 valign=uw.MIDDLE,
                 height=(uw.RELATIVE, 50),
             )
-        return super().keypress(size, key)
+        return key
 
 
 class AppTitleBar(uw.Text):
@@ -154,15 +162,8 @@ class ConnectDialog(uw.ListBox):
         self.attempt_auto_connect = False
         for section in config.keys():
             if section != "DEFAULT":
-                # if CONNECT_AUTOMATICALLY is set to anything other than
-                # 0 or FALSE/false/False, automatically connecting is enabled
-                settings_auto_connect = config.get(
-                    section=section, option="CONNECT_AUTOMATICALLY"
-                )
-                is_auto_connect = bool(
-                    settings_auto_connect
-                    and not settings_auto_connect.upper() == "FALSE"
-                    and not settings_auto_connect == "0"
+                is_auto_connect = is_enabled(
+                    config.get(section=section, option="CONNECT_AUTOMATICALLY")
                 )
                 if (
                     support_auto_connect
@@ -271,6 +272,7 @@ class ConnectDialog(uw.ListBox):
                     port=port if port else None,
                     username=user,
                     password=password,
+                    config_section=section,
                 )
                 # if successful, save off manual connection information
                 config.set(section=section, option="HOST", value=host)
@@ -295,6 +297,7 @@ class ConnectDialog(uw.ListBox):
                     verify_certificate=not bool(
                         config.get("DO_NOT_VERIFY_WEBUI_CERTIFICATE")
                     ),
+                    config_section=section,
                 )
 
             config.set_default_section(section)
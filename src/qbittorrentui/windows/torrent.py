@@ -1,17 +1,30 @@
+import heapq
 import logging
 import os
 from datetime import datetime
+from itertools import islice
 from time import time
 
 import blinker
 import urwid as uw
 
 from qbittorrentui._vendored.attrdict import AttrDict
-from qbittorrentui.config import INFINITY, SECS_INFINITY, config
+from qbittorrentui.config import (
+    DOWN_TRIANGLE,
+    INFINITY,
+    SECS_INFINITY,
+    UP_TRIANGLE,
+    config,
+)
 from qbittorrentui.connector import Connector
 from qbittorrentui.debug import log_keypress, log_timing
 from qbittorrentui.events import torrent_window_tab_change
-from qbittorrentui.formatters import natural_file_size, pretty_time_delta
+from qbittorrentui.formatters import (
+    natural_file_size,
+    natural_file_sizes,
+    pretty_time_delta,
+)
+from qbittorrentui.indexes import MaxMultiset
 from qbittorrentui.misc_widgets import DownloadProgressBar, SelectableText
 
 logger = logging.getLogger(__name__)
@@ -55,6 +68,7 @@ class TorrentWindow(uw.Columns):
         if tab is None:
             return
         self.content_column = self.tabs[tab]
+        self.main.daemon.set_sync_torrent_tab(torrent_hash=self.torrent_hash, tab=tab)
         self.contents[1] = (
             self.content_column,
             self.options(width_type=uw.WEIGHT, width_amount=90, box_widget=False),
@@ -70,6 +84,7 @@ class TorrentWindow(uw.Columns):
 
     def return_to_torrent_list(self):
         self.main.daemon.remove_sync_torrent_hash(torrent_hash=self.torrent_hash)
+        torrent_window_tab_change.disconnect(receiver=self.switch_tab_window)
         for tab_window in self.tabs.values():
             blinker.signal(self.torrent_hash).disconnect(receiver=tab_window.update)
         self.main.app_window.body = self.main.app_window.torrent_list_w
@@ -648,12 +663,76 @@ class TrackersDisplay(uw.ListBox):
 
 
 class PeersDisplay(uw.ListBox):
+    # column, width (None to fit the widest value), and alignment of the peers
+    COLUMNS = (
+        ("country_code", None, uw.LEFT),
+        ("ip", None, uw.RIGHT),
+        ("port", None, uw.RIGHT),
+        ("connection", None, uw.LEFT),
+        ("flags", None, uw.LEFT),
+        ("client", None, uw.LEFT),
+        ("progress", 4, uw.RIGHT),
+        ("dl_speed", 8, uw.RIGHT),
+        ("up_speed", 8, uw.RIGHT),
+        ("downloaded", 6, uw.RIGHT),
+        ("uploaded", 6, uw.RIGHT),
+        ("relevance", 4, uw.LEFT),
+        ("files", None, uw.LEFT),
+    )
+    TITLES = dict(
+        country_code="C",
+        ip="IP",
+        port="Port",
+        connection="Conn",
+        flags="Flags",
+        client="Client",
+        progress="Prog",
+        dl_speed="Down",
+        up_speed="Up",
+        downloaded="Down'd",
+        uploaded="Up'd",
+        relevance="Rel",
+        files="Files",
+    )
+    # widths of the fitted columns while there aren't any peers
+    MIN_WIDTHS = dict(country_code=1, ip=7, port=4, connection=4, flags=5, client=5)
+    SIZE_COLUMNS = ("dl_speed", "up_speed", "downloaded", "uploaded")
+    SORT_COLUMNS = {
+        "dl_speed": lambda p: p.get("dl_speed", 0),
+        "up_speed": lambda p: p.get("up_speed", 0),
+        "progress": lambda p: p.get("progress", 0),
+        "relevance": lambda p: p.get("relevance", 0),
+        "client": lambda p: (p.get("client") or "").lower(),
+        "country_code": lambda p: (p.get("country_code") or "").lower(),
+    }
+
     def __init__(self):
         self.walker = uw.SimpleFocusListWalker([])
         super().__init__(self.walker)
 
+        self.peers = {}
+        """Data for each peer keyed by ip:port."""
+        # rows are only built for the peers on the current page
+        self.peer_rows = {}
+        self.page = 0
+        self.page_size = max(config.settings.torrent_peers_page_size, 1)
+        self.sort_column = "dl_speed"
+        self.sort_descending = True
+        # lengths of the values in each fitted column to size the columns
+        self._value_lengths = {column: MaxMultiset() for column in self.MIN_WIDTHS}
+        self.widths = dict(self.MIN_WIDTHS)
+        self.status_w = uw.Text("", wrap=uw.CLIP)
+        self.title_bar_w = PeersDisplay.PeerRow(self.TITLES, self.widths, title=True)
+        self.walker.extend([uw.Divider(), self.status_w, self.title_bar_w])
+        self.update_status_text()
+
     def update(self, sender, **kw):
         """
+        Apply the changes to the torrent's peers from the daemon.
+
+        Every peer is kept but only the peers on the current page are
+        formatted and shown.
+
         sample peer entry:
         '96.51.101.249:57958': {'client': 'μTorrent 3.5.5',
                                'connection': 'μTP',
@@ -680,183 +759,220 @@ class PeersDisplay(uw.ListBox):
         :return:
         """
         start_time = time()
-        peers = kw.get("sync_torrent_peers", {})
-
-        min_country_len = 1  # len("C")
-        min_connection_len = 4  # len("Conn")
-        min_flags_len = 5  # len("Flags")
-        min_client_len = 5  # len("Client")
-        min_ip_len = 7  # len("0.0.0.0")
-        min_port_len = 4
-        max_dl_speed_len = 8
-        max_up_speed_len = max_dl_speed_len
-        max_downloaded_len = 6
-        max_uploaded_len = max_downloaded_len
-        max_relevance_len = 4
-        max_progress_len = 4
-
-        peers_values = peers.values()
-        max_country_len = max(
-            map(len, (p.get("country_code", "") for p in peers_values)),
-            default=min_country_len,
-        )
-        max_flags_len = max(
-            map(len, (p.get("flags", "") for p in peers_values)), default=min_flags_len
-        )
-        max_connection_len = max(
-            map(len, (p.get("connection", "") for p in peers_values)),
-            default=min_connection_len,
-        )
-        max_client_len = max(
-            map(len, (p.get("client", "") for p in peers_values)),
-            default=min_client_len,
-        )
-        max_ip_len = max(
-            map(len, (str(p.get("ip", "")) for p in peers_values)), default=min_ip_len
-        )
-        max_port_len = max(
-            map(len, (str(p.get("port", "")) for p in peers_values)),
-            default=min_port_len,
-        )
+        changes = kw.get("sync_torrent_peers") or {}
 
-        title_bar = dict(
-            client="Client",
-            connection="Conn",
-            country="Country",
-            country_code="C",
-            dl_speed="Down",
-            downloaded="Down'd",
-            files="Files",
-            flags="Flags",
-            ip="IP",
-            port="Port",
-            progress="Prog",
-            relevance="Rel",
-            up_speed="Up",
-            uploaded="Up'd",
-        )
+        if changes.get("full_update", False):
+            self.peers.clear()
+            self.clear_rows()
 
-        title_bar_w = uw.Columns(
-            [
-                (
-                    max_country_len,
-                    uw.Text(title_bar["country_code"], wrap=uw.CLIP),
-                ),
-                (max_ip_len, uw.Text(str(title_bar["ip"]), wrap=uw.CLIP)),
-                (max_port_len, uw.Text(str(title_bar["port"]), wrap=uw.CLIP)),
-                (
-                    max_connection_len,
-                    uw.Text(title_bar["connection"], wrap=uw.CLIP),
-                ),
-                (max_flags_len, uw.Text(title_bar["flags"], wrap=uw.CLIP)),
-                (max_client_len, uw.Text(title_bar["client"], wrap=uw.CLIP)),
-                (max_progress_len, uw.Text(title_bar["progress"], wrap=uw.CLIP)),
-                (max_dl_speed_len, uw.Text(title_bar["dl_speed"], wrap=uw.CLIP)),
-                (max_up_speed_len, uw.Text(title_bar["up_speed"], wrap=uw.CLIP)),
-                (
-                    max_downloaded_len,
-                    uw.Text(title_bar["downloaded"], wrap=uw.CLIP),
-                ),
-                (max_uploaded_len, uw.Text(title_bar["uploaded"], wrap=uw.CLIP)),
-                (
-                    max_relevance_len,
-                    uw.Text(title_bar["relevance"], wrap=uw.CLIP),
-                ),
-                (uw.Text(str(title_bar["files"]), wrap=uw.CLIP)),
-            ],
-            dividechars=1,
-        )
+        for peer_key in changes.get("peers_removed", []):
+            self.peers.pop(peer_key, None)
 
-        peer_w_list = [title_bar_w]
-        for peer in peers_values:
-            peer_w_list.append(
-                uw.Columns(
-                    [
-                        (
-                            max_country_len,
-                            uw.Text(peer.get("country_code", "").upper(), wrap=uw.CLIP),
-                        ),
-                        (
-                            max_ip_len,
-                            uw.Text(
-                                str(peer.get("ip", "")), wrap=uw.CLIP, align=uw.RIGHT
-                            ),
-                        ),
-                        (
-                            max_port_len,
-                            uw.Text(
-                                str(peer.get("port", "")), align=uw.RIGHT, wrap=uw.CLIP
-                            ),
-                        ),
-                        (
-                            max_connection_len,
-                            uw.Text(peer.get("connection", ""), wrap=uw.CLIP),
-                        ),
-                        (max_flags_len, uw.Text(peer.get("flags", ""), wrap=uw.CLIP)),
-                        (max_client_len, uw.Text(peer.get("client", ""), wrap=uw.CLIP)),
-                        (
-                            max_progress_len,
-                            uw.Text(
-                                f"{peer.get('progress', '') * 100:3.0f}%",
-                                align=uw.RIGHT,
-                                wrap=uw.CLIP,
-                            ),
-                        ),
-                        (
-                            max_dl_speed_len,
-                            uw.Text(
-                                f"{natural_file_size(peer.get('dl_speed', ''), gnu=True)}/s",
-                                align=uw.RIGHT,
-                                wrap=uw.CLIP,
-                            ),
-                        ),
-                        (
-                            max_up_speed_len,
-                            uw.Text(
-                                f"{natural_file_size(peer.get('up_speed', ''), gnu=True)}/s",
-                                align=uw.RIGHT,
-                                wrap=uw.CLIP,
-                            ),
-                        ),
-                        (
-                            max_downloaded_len,
-                            uw.Text(
-                                natural_file_size(peer.get("downloaded", ""), gnu=True),
-                                align=uw.RIGHT,
-                                wrap=uw.CLIP,
-                            ),
-                        ),
-                        (
-                            max_uploaded_len,
-                            uw.Text(
-                                natural_file_size(peer.get("uploaded", ""), gnu=True),
-                                align=uw.RIGHT,
-                                wrap=uw.CLIP,
-                            ),
-                        ),
-                        (
-                            max_relevance_len,
-                            uw.Text(
-                                f"{peer.get('relevance', '') * 100:3.0f}%", wrap=uw.CLIP
-                            ),
-                        ),
-                        (uw.Text(peer.get("files", ""), wrap=uw.CLIP)),
-                    ],
-                    dividechars=1,
-                )
-            )
+        peer_changes = changes.get("peers", {})
+        for peer_key, peer in peer_changes.items():
+            self.peers.setdefault(peer_key, {}).update(peer)
 
-        self.walker.clear()
-        self.walker.append(uw.Divider())
-        self.walker.extend(peer_w_list)
+        self.refresh_page(peer_changes)
 
         assert log_timing(logger, "Updating", self, sender, start_time)
 
+    def clear_rows(self):
+        self.peer_rows.clear()
+        for lengths in self._value_lengths.values():
+            lengths.clear()
+
+    def page_peer_keys(self):
+        """
+        Select the peers on the current page in sort order.
+
+        Only the peers up to the end of the page are selected (with a heap)
+        rather than sorting every peer.
+        """
+        start = self.page * self.page_size
+        end = start + self.page_size
+        if self.sort_column is None:
+            return list(islice(self.peers, start, end))
+        sort_value = self.SORT_COLUMNS[self.sort_column]
+        select = heapq.nlargest if self.sort_descending else heapq.nsmallest
+        selected = select(end, self.peers, key=lambda k: (sort_value(self.peers[k]), k))
+        return selected[start:]
+
+    def refresh_page(self, peer_changes: dict = None):
+        """
+        Show the peers for the current page.
+
+        Rows are kept for peers that stay on the page and only the cells for
+        the data that changed are updated; peers that leave the page lose
+        their rows.
+
+        :param peer_changes: data that changed for each peer since the last refresh
+        """
+        peer_changes = peer_changes or {}
+        page_count = max((len(self.peers) - 1) // self.page_size + 1, 1)
+        self.page = min(self.page, page_count - 1)
+        page_keys = self.page_peer_keys()
+
+        for peer_key in set(self.peer_rows).difference(page_keys):
+            peer_row_w = self.peer_rows.pop(peer_key)
+            for column, lengths in self._value_lengths.items():
+                lengths.remove(len(peer_row_w.cells[column].text))
+
+        for peer_key in page_keys:
+            peer_row_w = self.peer_rows.get(peer_key)
+            if peer_row_w is None:
+                texts = self.format_peer(self.peers[peer_key])
+                self.peer_rows[peer_key] = PeersDisplay.PeerRow(texts, self.widths)
+                for column, lengths in self._value_lengths.items():
+                    lengths.add(len(texts.get(column, "")))
+            elif peer_key in peer_changes:
+                texts = self.format_peer(peer_changes[peer_key])
+                for column, lengths in self._value_lengths.items():
+                    if column in texts:
+                        old_text = peer_row_w.cells[column].text
+                        lengths.replace(len(old_text), len(texts[column]))
+                peer_row_w.update(texts)
+
+        page_rows = [self.peer_rows[peer_key] for peer_key in page_keys]
+        if self.walker[3:] != page_rows:
+            focus_w = self.focus
+            self.walker[3:] = page_rows
+            if focus_w in page_rows:
+                self.walker.set_focus(page_rows.index(focus_w) + 3)
+
+        self.resize_columns()
+        self.update_status_text()
+
+    def update_status_text(self):
+        """Show which peers are on the page and how they're sorted."""
+        start = self.page * self.page_size
+        end = min(start + self.page_size, len(self.peers))
+        status = [f"Peers {min(start + 1, end)}-{end} of {len(self.peers)}"]
+        if self.sort_column is not None:
+            arrow = DOWN_TRIANGLE if self.sort_descending else UP_TRIANGLE
+            status.append(f"Sorted by {self.TITLES[self.sort_column]} {arrow}")
+        self.status_w.set_text(" | ".join(status))
+
+    def cycle_sort_column(self):
+        """Sort by the next column; the last option is the order peers connected."""
+        columns = [*self.SORT_COLUMNS, None]
+        column = columns[(columns.index(self.sort_column) + 1) % len(columns)]
+        # numbers start with the largest and text starts alphabetically
+        self.set_sort(column, descending=column not in ("client", "country_code"))
+
+    def toggle_sort_direction(self):
+        self.set_sort(self.sort_column, descending=not self.sort_descending)
+
+    def set_sort(self, column: str = None, descending: bool = False):
+        """
+        Sort the peers by a column and return to the first page.
+
+        :param column: one of SORT_COLUMNS or None for the order peers connected
+        :param descending: whether to sort largest first
+        """
+        self.sort_column = column
+        self.sort_descending = descending
+        self.page = 0
+        self.refresh_page()
+
+    def change_page(self, pages: int):
+        page = max(self.page + pages, 0)
+        if page * self.page_size < len(self.peers) and page != self.page:
+            self.page = page
+            self.refresh_page()
+
+    def resize_columns(self):
+        """Fit the columns to their widest values; rows are only touched if a width changed."""
+        widths = {
+            column: lengths.max(default=self.MIN_WIDTHS[column])
+            for column, lengths in self._value_lengths.items()
+        }
+        if widths == {c: self.widths[c] for c in widths}:
+            return
+        self.widths.update(widths)
+        self.title_bar_w.resize(self.widths)
+        for peer_row_w in self.peer_rows.values():
+            peer_row_w.resize(self.widths)
+
+    @classmethod
+    def format_peer(cls, peer: dict):
+        """
+        Format the data for a peer.
+
+        :param peer: data for the peer (or just the data that changed)
+        :return: text for each column with data
+        """
+        texts = {}
+        sizes = [column for column in cls.SIZE_COLUMNS if column in peer]
+        for column, size in zip(
+            sizes, natural_file_sizes((peer[c] for c in sizes), gnu=True)
+        ):
+            texts[column] = f"{size}/s" if column.endswith("speed") else size
+        if "country_code" in peer:
+            texts["country_code"] = peer["country_code"].upper()
+        for column in ("ip", "port", "connection", "flags", "client", "files"):
+            if column in peer:
+                texts[column] = str(peer[column])
+        for column in ("progress", "relevance"):
+            if column in peer:
+                texts[column] = f"{peer[column] * 100:3.0f}%"
+        return texts
+
     def keypress(self, size, key):
         log_keypress(logger, self, key)
         key = super().keypress(size, key)
+        if key == "s":
+            self.cycle_sort_column()
+            key = None
+        elif key == "S":
+            self.toggle_sort_direction()
+            key = None
+        elif key == "]":
+            self.change_page(1)
+            key = None
+        elif key == "[":
+            self.change_page(-1)
+            key = None
         return key
 
+    class PeerRow(uw.Columns):
+        def __init__(self, texts: dict, widths: dict, title=False):
+            """
+            Row of the peers display.
+
+            :param texts: text for each column
+            :param widths: widths for the fitted columns
+            :param title: whether the row is the title bar (which is all left aligned)
+            """
+            self.cells = {}
+            columns = []
+            for column, width, align in PeersDisplay.COLUMNS:
+                cell = uw.Text(
+                    texts.get(column, ""),
+                    align=uw.LEFT if title else align,
+                    wrap=uw.CLIP,
+                )
+                self.cells[column] = cell
+                if column == "files":
+                    columns.append(cell)
+                else:
+                    columns.append((width or widths[column], cell))
+            super().__init__(columns, dividechars=1)
+
+        def update(self, texts: dict):
+            for column, text in texts.items():
+                cell = self.cells[column]
+                if cell.text != text:
+                    cell.set_text(text)
+
+        def resize(self, widths: dict):
+            for i, (column, _, _) in enumerate(PeersDisplay.COLUMNS):
+                width = widths.get(column)
+                if width is not None and self.contents[i][1][1] != width:
+                    self.contents[i] = (
+                        self.cells[column],
+                        self.options(uw.GIVEN, width),
+                    )
+
 
 class ContentDisplay(uw.Pile):
     """
@@ -879,6 +995,7 @@ class ContentDisplay(uw.Pile):
         self.focused_path = None
         self.focused_node_class = ContentDisplay.DirectoryNode
         self.collapsed_dirs = []
+        self._torrent_content = None
 
         self.title_bar = uw.Columns(
             [
@@ -909,6 +1026,11 @@ class ContentDisplay(uw.Pile):
         start_time = time()
         torrent_content = kw.get("content", [])
 
+        # the daemon only replaces the content when it actually changes
+        if torrent_content is self._torrent_content:
+            return
+        self._torrent_content = torrent_content
+
         content = ContentDisplay.Content(
             client=self.client,
             torrent_hash=self.torrent_hash,
@@ -1111,7 +1233,7 @@ class ContentDisplay(uw.Pile):
             dir_node_offset = 3 if is_dir else 0
             depth_offset = (self.get_node().get_depth()) * 3
             filename_width = (
-                int(config.get("TORRENT_CONTENT_MAX_FILENAME_LENGTH"))
+                config.settings.torrent_content_max_filename_length
                 - depth_offset
                 - file_node_offset
                 - dir_node_offset
@@ -1,7 +1,11 @@
 import logging
-from contextlib import suppress
-from re import sub as re_sub
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from functools import lru_cache, total_ordering
+from itertools import count
+from re import compile as re_compile
 from time import sleep, time
+from urllib.parse import urlsplit
 
 import panwid
 import urwid as uw
@@ -9,7 +13,6 @@ import urwid as uw
 from qbittorrentui._vendored.attrdict import AttrDict
 from qbittorrentui.config import (
     DOWN_TRIANGLE,
-    INFINITY,
     SECS_INFINITY,
     STATE_MAP_FOR_DISPLAY,
     TORRENT_LIST_FILTERING_STATE_MAP,
@@ -23,9 +26,11 @@ from qbittorrentui.events import (
     initialize_torrent_list,
     refresh_torrent_list_now,
     server_torrents_changed,
+    settings_changed,
     update_torrent_list_now,
 )
-from qbittorrentui.formatters import natural_file_size, pretty_time_delta
+from qbittorrentui.formatters import format_eta, natural_file_size
+from qbittorrentui.indexes import FacetIndex, MaxMultiset, TextSearch
 from qbittorrentui.misc_widgets import (
     ButtonWithoutCursor,
     DownloadProgressBar,
@@ -48,15 +53,27 @@ class TorrentListWindow(uw.Pile):
 
         self._width = None
 
+        # refreshes are requested by the senders here and run when rendering;
+        # a refresh runs at most once per frame and at a limited rate
+        self._refresh_requests = set()
+        self._refresh_min_interval = config.settings.torrent_list_refresh_min_interval
+        self._last_refresh_time = 0
+        self._refresh_alarm = None
+
         # initialize torrent list
         self.torrent_list_w = TorrentList(self)
 
         #  Set up torrent status tabs
         self.torrent_tabs_w = TorrentListTabsColumns()
 
+        # search bar and how the torrents are sorted
+        self.search_w = uw.Edit(caption="Search: ", wrap=uw.CLIP)
+        uw.connect_signal(self.search_w, "postchange", self.search_torrent_list)
+        self.sort_w = uw.Text("", align=uw.RIGHT, wrap=uw.CLIP)
+
         pile = [
             (1, self.torrent_tabs_w),
-            (1, uw.Filler(uw.Divider())),
+            (1, uw.Filler(uw.Columns([self.search_w, (uw.PACK, self.sort_w)]))),
             self.torrent_list_w,
         ]
 
@@ -65,6 +82,11 @@ class TorrentListWindow(uw.Pile):
 
         # signals
         initialize_torrent_list.connect(receiver=self.torrent_list_init)
+        settings_changed.connect(receiver=self.apply_settings)
+
+    def apply_settings(self, sender, settings):
+        self._refresh_min_interval = settings.torrent_list_refresh_min_interval
+        self.request_refresh(sender)
 
     @property
     def width(self):
@@ -77,8 +99,10 @@ class TorrentListWindow(uw.Pile):
         start_time = time()
         if self._width != size[0]:
             self._width = size[0]
-            # call to refresh_torrent_list on screen re-sizes
-            refresh_torrent_list_now.send("torrent list render")
+            # refresh the torrent list on screen re-sizes
+            self._refresh_requests.add("torrent list render")
+        if self._refresh_requests:
+            self.refresh_torrent_list_when_due()
         ret = super().render(size, focus)
         assert log_timing(logger, "Rendering", self, "render", start_time)
         return ret
@@ -86,7 +110,20 @@ class TorrentListWindow(uw.Pile):
     def keypress(self, size, key):
         log_keypress(logger, self, key)
         key = super().keypress(size, key)
-        if key in ["a", "A"]:
+        if self.focus_position == 1:
+            # keys left over from the search bar
+            if key == "enter":
+                self.focus_position = 2
+            elif key == "esc":
+                self.search_w.set_edit_text("")
+                self.focus_position = 2
+            else:
+                return key
+            return None
+        if key == "/":
+            self.focus_position = 1
+            key = None
+        elif key in ["a", "A"]:
             self.main.loop.widget = uw.Overlay(
                 top_w=uw.LineBox(TorrentAddDialog(self.main)),
                 bottom_w=self.main.app_window,
@@ -96,12 +133,46 @@ class TorrentListWindow(uw.Pile):
                 height=(uw.RELATIVE, 50),
                 min_width=20,
             )
+        elif key in ["f", "F"]:
+            self.main.loop.widget = uw.Overlay(
+                top_w=uw.LineBox(TorrentFacetDialog(self), title="Filter"),
+                bottom_w=self.main.app_window,
+                align=uw.CENTER,
+                valign=uw.MIDDLE,
+                width=(uw.RELATIVE, 50),
+                height=(uw.RELATIVE, 50),
+                min_width=20,
+            )
+            key = None
+        elif key == "s":
+            self.torrent_list_w.cycle_sort_column()
+            key = None
+        elif key == "S":
+            self.torrent_list_w.toggle_sort_direction()
+            key = None
         return key
 
+    def search_torrent_list(self, edit_w, old_text):
+        self.torrent_list_w.set_search(edit_w.get_edit_text())
+
+    def update_status_text(self):
+        """Show how the torrents are filtered and sorted next to the search bar."""
+        status = []
+        if self.torrent_list_w.facet_filter is not None:
+            facet, value = self.torrent_list_w.facet_filter
+            status.append(f"{facet}: {TorrentList.facet_label(facet, value)}")
+        column = self.torrent_list_w.sort_column
+        if column is not None:
+            arrow = (
+                DOWN_TRIANGLE if self.torrent_list_w.sort_descending else UP_TRIANGLE
+            )
+            status.append(f"Sorted by {column} {arrow}")
+        self.sort_w.set_text(" | ".join(status) + (" " if status else ""))
+
     def torrent_list_init(self, sender):
         """Once connected to qbittorrent, initialize torrent list window."""
         server_torrents_changed.connect(receiver=self.update_torrent_list)
-        refresh_torrent_list_now.connect(receiver=self.refresh_torrent_list)
+        refresh_torrent_list_now.connect(receiver=self.request_refresh)
         update_torrent_list_now.send("initialization")
 
     def update_torrent_list(
@@ -130,7 +201,42 @@ class TorrentListWindow(uw.Pile):
 
         assert log_timing(logger, "Updating", self, sender, start_time)
 
+        self.request_refresh(sender)
+
+    def request_refresh(self, sender):
+        """
+        Refresh the torrent list the next time it is rendered.
+
+        Requests made before the list is rendered again are combined in to a
+        single refresh.
+
+        :param sender:
+        """
+        self._refresh_requests.add(sender)
+        self._invalidate()
+
+    def refresh_torrent_list_when_due(self):
+        """
+        Refresh the torrent list for the requests unless it was refreshed too recently.
+
+        Once the minimum interval has passed, an alarm renders the list again
+        to run the refresh.
+        """
+        wait = self._last_refresh_time + self._refresh_min_interval - time()
+        if wait > 0:
+            if self._refresh_alarm is None:
+                self._refresh_alarm = self.main.loop.set_alarm_in(
+                    wait, callback=self._refresh_alarm_expired
+                )
+            return
+        sender = ", ".join(sorted(self._refresh_requests))
+        self._refresh_requests.clear()
         self.refresh_torrent_list(sender)
+        self._last_refresh_time = time()
+
+    def _refresh_alarm_expired(self, loop, _):
+        self._refresh_alarm = None
+        self._invalidate()
 
     def refresh_torrent_list(self, sender):
         """
@@ -161,13 +267,100 @@ class TorrentListWindow(uw.Pile):
 
 
 class TorrentList(uw.ListBox):
+    STATUS_TABS = ("all", *TORRENT_LIST_FILTERING_STATE_MAP)
+    SORT_COLUMNS = {
+        "name": lambda t: (t.get("name") or "").lower(),
+        "size": lambda t: t.get("size", 0),
+        "progress": lambda t: t.get("progress", 0),
+        "dlspeed": lambda t: t.get("dlspeed", 0),
+        "upspeed": lambda t: t.get("upspeed", 0),
+        "ratio": lambda t: t.get("ratio", 0),
+        "eta": lambda t: t.get("eta", 0),
+        "added_on": lambda t: t.get("added_on", 0),
+        "category": lambda t: (t.get("category") or "").lower(),
+    }
+    # facets to filter torrents by and the torrent data each comes from
+    FACETS = {
+        "category": "category",
+        "tag": "tags",
+        "tracker": "tracker",
+    }
+    # torrents are only moved when these values change by more than the
+    # hysteresis so rows don't jump around with every small fluctuation;
+    # small values use the hysteresis of the floor (bytes/s or seconds)
+    VOLATILE_SORT_COLUMNS = {"dlspeed": 1024, "upspeed": 1024, "eta": 10}
+
     def __init__(self, torrent_list_box):
         super().__init__(uw.SimpleFocusListWalker([uw.Text("Loading...")]))
         # currently needed for resizing and creating TorrentRows
         self.torrent_list_box_w = torrent_list_box
 
-        self.torrent_row_store = {}
-        """Master torrent row widget list of all torrents."""
+        self.torrent_store = {}
+        """Master store of the data for all torrents."""
+
+        # rows are only built for torrents as they are displayed
+        self._torrent_rows = OrderedDict()
+        self._max_cached_rows = config.settings.torrent_list_row_cache_size
+        self._row_class = self.row_class(config.settings)
+        # changes for built rows that haven't been displayed yet
+        self._pending_row_updates = {}
+
+        # torrents in each status tab in display order; kept up to date as
+        # torrents change state so switching tabs doesn't filter every torrent
+        self._tab_torrents = {tab: [] for tab in self.STATUS_TABS}
+        self._insertion_seq = {}
+        self._next_insertion_seq = count()
+        self.status_filter = "all"
+
+        # key each torrent was last sorted with; ties keep insertion order
+        self._sort_keys = {}
+        self.sort_column = None
+        self.sort_descending = False
+        self._sort_hysteresis = config.settings.torrent_list_sort_hysteresis
+
+        # lengths of all torrent names to size the name column
+        self._name_lengths = MaxMultiset()
+
+        # when torrents are searched for, the status tab is filtered further
+        # in to a separate list that's kept up to date the same way
+        self._name_search = TextSearch()
+        self._view_torrents = None
+        self._is_view_stale = False
+
+        # torrents with each category, tag, and tracker
+        self._facets = {facet: FacetIndex() for facet in self.FACETS}
+        self.facet_filter = None
+
+        self.walker = TorrentListWalker(
+            get_row=self.get_torrent_row, position_of=self.position_of
+        )
+
+        self.row_sizing = None
+        self.name_len = 0
+
+        settings_changed.connect(receiver=self.apply_settings)
+
+    def apply_settings(self, sender, settings):
+        """
+        Use new settings.
+
+        Rows are discarded so they're built again for the new settings as
+        they're displayed and the layout is determined again on the next
+        refresh.
+        """
+        self._max_cached_rows = settings.torrent_list_row_cache_size
+        self._row_class = self.row_class(settings)
+        self._sort_hysteresis = settings.torrent_list_sort_hysteresis
+        self._torrent_rows.clear()
+        self._pending_row_updates.clear()
+        self.row_sizing = None
+
+    @staticmethod
+    def row_class(settings):
+        """Row widget for the renderer in the settings."""
+        if settings.torrent_list_row_renderer.lower() == "widgets":
+            return TorrentRow
+        return TorrentTextRow
 
     def keypress(self, size, key):
         log_keypress(logger, self, key)
@@ -175,12 +368,9 @@ class TorrentList(uw.ListBox):
         return key
 
     def get_torrent_hash_for_focused_row(self):
-        focused_row, focused_row_pos = self.body.get_focus()
-        if focused_row is None:
+        if self.body is not self.walker:
             return None
-        if isinstance(focused_row.base_widget, TorrentRow):
-            return focused_row.base_widget.get_torrent_hash()
-        return None
+        return self.walker.get_focus_hash()
 
     def set_torrent_list_focus(self, sender="", torrent_hash: str = None):
         """
@@ -189,61 +379,335 @@ class TorrentList(uw.ListBox):
         :param sender:
         :param torrent_hash:
         """
-        found = False
-        if torrent_hash is not None:
-            for pos, torrent_row_w in enumerate(self.body):
-                if torrent_row_w.base_widget.get_torrent_hash() == torrent_hash:
-                    self.body.set_focus(pos)
-                    found = True
-                    break
-        if not found:
+        if self.body is self.walker:
+            self.walker.set_focus_hash(torrent_hash)
+        else:
             self.body.set_focus(0)
 
+    def position_of(self, torrent_hash: str, hashes: list = None):
+        """
+        Find a torrent in a list of torrents.
+
+        Lists are kept in order of their sort key so the torrent can be found
+        by bisection instead of scanning the list. The walker uses this to
+        look up where the focused torrent is whenever the focus is needed.
+
+        :param torrent_hash:
+        :param hashes: list of torrents; defaults to the displayed torrents
+        :return: position of the torrent or None if it isn't in the list
+        """
+        if torrent_hash not in self._sort_keys:
+            return None
+        if hashes is None:
+            hashes = self.walker.hashes
+        pos = bisect_left(hashes, self._sort_key(torrent_hash), key=self._sort_key)
+        if pos < len(hashes) and hashes[pos] == torrent_hash:
+            return pos
+        return None
+
     def apply_torrent_list_filter(self, status_filter: str):
-        filtered_list = []
-        if status_filter != "all":
-            for torrent_row_w in self.torrent_row_store.values():
-                state = torrent_row_w.base_widget.cached_torrent["state"]
-                if state in TORRENT_LIST_FILTERING_STATE_MAP[status_filter]:
-                    filtered_list.append(torrent_row_w)
+        if status_filter != self.status_filter:
+            self._is_view_stale = True
+        self.status_filter = status_filter
+
+        if not self._name_search.query and self.facet_filter is None:
+            self._view_torrents = None
+            self.walker.set_hashes(self._tab_torrents[status_filter])
         else:
-            filtered_list.extend(self.torrent_row_store.values())
+            if self._view_torrents is None or self._is_view_stale:
+                if self.facet_filter is not None:
+                    facet, value = self.facet_filter
+                    candidates = self._facets[facet].members(value)
+                else:
+                    candidates = self._name_search.matches
+                self._view_torrents = sorted(
+                    filter(self._is_in_view, candidates), key=self._sort_key
+                )
+            self.walker.set_hashes(self._view_torrents)
+        self._is_view_stale = False
+        self.body = self.walker
+
+    def set_search(self, text: str):
+        """
+        Only show torrents whose name contains the text.
+
+        :param text: text to search for; empty to show all torrents
+        """
+        self._name_search.search(text)
+        self._is_view_stale = True
+        refresh_torrent_list_now.send("torrent list search")
+
+    def set_facet_filter(self, facet: str = None, value: str = None):
+        """
+        Only show torrents with a category, tag, or tracker.
+
+        :param facet: one of FACETS or None to show all torrents
+        :param value: category, tag, or tracker domain
+        """
+        self.facet_filter = (facet, value) if facet is not None else None
+        self._is_view_stale = True
+        self.torrent_list_box_w.update_status_text()
+        refresh_torrent_list_now.send("torrent list facet")
+
+    def facet_counts(self, facet: str):
+        """Number of torrents with each value of a facet."""
+        return self._facets[facet].counts()
+
+    @staticmethod
+    def facet_values(facet: str, torrent: dict):
+        """Values of a facet for a torrent."""
+        value = torrent.get(TorrentList.FACETS[facet]) or ""
+        if facet == "tag":
+            return [tag.strip() for tag in value.split(",") if tag.strip()]
+        if facet == "tracker":
+            return [tracker_domain(value)]
+        return [value]
+
+    @staticmethod
+    def facet_label(facet: str, value: str):
+        return value if value else f"<no {facet}>"
+
+    def _set_facets(self, torrent_hash: str, torrent: dict, changes: dict):
+        for facet, facet_index in self._facets.items():
+            if self.FACETS[facet] in changes:
+                facet_index.set(torrent_hash, self.facet_values(facet, torrent))
+
+    def _is_in_view(self, torrent_hash: str):
+        torrent = self.torrent_store[torrent_hash]
+        if self.facet_filter is not None:
+            facet, value = self.facet_filter
+            if torrent_hash not in self._facets[facet].members(value):
+                return False
+        return (
+            self.status_filter in self.status_tabs_for_state(torrent.get("state"))
+            and torrent_hash in self._name_search
+        )
 
-        self.body = uw.SimpleFocusListWalker(filtered_list)
+    def _add_to_view(self, torrent_hash: str):
+        if self._view_torrents is not None and self._is_in_view(torrent_hash):
+            insort(self._view_torrents, torrent_hash, key=self._sort_key)
+
+    def _remove_from_view(self, torrent_hash: str):
+        if self._view_torrents is not None:
+            pos = self.position_of(torrent_hash, hashes=self._view_torrents)
+            if pos is not None:
+                del self._view_torrents[pos]
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def status_tabs_for_state(state: str):
+        """Status tabs a torrent in this state is listed in."""
+        return frozenset({"all"}).union(
+            tab
+            for tab, states in TORRENT_LIST_FILTERING_STATE_MAP.items()
+            if state in states
+        )
+
+    def _sort_key(self, torrent_hash: str):
+        return self._sort_keys[torrent_hash]
+
+    def _make_sort_key(self, torrent_hash: str, torrent: dict):
+        seq = self._insertion_seq[torrent_hash]
+        if self.sort_column is None:
+            return (seq,)
+        value = self.SORT_COLUMNS[self.sort_column](torrent)
+        if self.sort_descending:
+            value = _Reversed(value)
+        return (value, seq)
+
+    def _is_sort_key_changed(self, torrent_hash: str, torrent: dict):
+        """Whether the torrent needs to move for a change to its data."""
+        if self.sort_column is None:
+            return False
+        old_value = self._sort_keys[torrent_hash][0]
+        if isinstance(old_value, _Reversed):
+            old_value = old_value.value
+        new_value = self.SORT_COLUMNS[self.sort_column](torrent)
+        if self.sort_column in self.VOLATILE_SORT_COLUMNS:
+            floor = self.VOLATILE_SORT_COLUMNS[self.sort_column]
+            threshold = self._sort_hysteresis * max(abs(old_value), floor)
+            return abs(new_value - old_value) > threshold
+        return new_value != old_value
+
+    def cycle_sort_column(self):
+        """Sort by the next column; the last option is the order torrents were added."""
+        columns = [*self.SORT_COLUMNS, None]
+        self.set_sort(columns[(columns.index(self.sort_column) + 1) % len(columns)])
+
+    def toggle_sort_direction(self):
+        self.set_sort(self.sort_column, descending=not self.sort_descending)
+
+    def set_sort(self, column: str = None, descending: bool = False):
+        """
+        Sort the torrents by a column.
+
+        This is the only time every torrent is sorted; afterwards, only
+        torrents whose value for the column changes are moved.
+
+        :param column: one of SORT_COLUMNS or None for the order torrents were added
+        :param descending:
+        """
+        self.sort_column = column
+        self.sort_descending = descending
+        for torrent_hash, torrent in self.torrent_store.items():
+            self._sort_keys[torrent_hash] = self._make_sort_key(torrent_hash, torrent)
+        for tab_torrents in self._tab_torrents.values():
+            tab_torrents.sort(key=self._sort_key)
+        if self._view_torrents is not None:
+            self._view_torrents.sort(key=self._sort_key)
+        self.torrent_list_box_w.update_status_text()
+        refresh_torrent_list_now.send("torrent list sort")
+
+    def _add_to_tabs(self, torrent_hash: str, tabs: set):
+        for tab in tabs:
+            insort(self._tab_torrents[tab], torrent_hash, key=self._sort_key)
+
+    def _remove_from_tabs(self, torrent_hash: str, tabs: set):
+        for tab in tabs:
+            pos = self.position_of(torrent_hash, hashes=self._tab_torrents[tab])
+            if pos is not None:
+                del self._tab_torrents[tab][pos]
 
     def update(self, torrents: dict, torrents_removed: dict, full_update=False):
+        # the list is changed in place and may not be refreshed right away;
+        # so, note where the focused torrent is before it can be removed
+        focus_hash = self.get_torrent_hash_for_focused_row()
+        focus_sort_key = self._sort_keys.get(focus_hash)
+
         for torrent_hash in torrents_removed:
-            self.torrent_row_store.pop(torrent_hash)
+            # merged deltas may remove a torrent this list never received
+            torrent = self.torrent_store.pop(torrent_hash, None)
+            if torrent is not None:
+                self._remove_from_view(torrent_hash)
+                self._name_search.remove(torrent_hash)
+                for facet_index in self._facets.values():
+                    facet_index.remove(torrent_hash)
+                self._name_lengths.remove(len(torrent.get("name", "")))
+                self._remove_from_tabs(
+                    torrent_hash, self.status_tabs_for_state(torrent.get("state"))
+                )
+                del self._insertion_seq[torrent_hash]
+                del self._sort_keys[torrent_hash]
+            self._torrent_rows.pop(torrent_hash, None)
+            self._pending_row_updates.pop(torrent_hash, None)
 
         if full_update:
-            self.torrent_row_store = {}
+            self.torrent_store = {}
+            self._torrent_rows.clear()
+            self._pending_row_updates = {}
+            for tab_torrents in self._tab_torrents.values():
+                tab_torrents.clear()
+            self._insertion_seq = {}
+            self._sort_keys = {}
+            self._name_lengths.clear()
+            self._name_search.clear()
+            for facet_index in self._facets.values():
+                facet_index.clear()
+            if self._view_torrents is not None:
+                self._view_torrents.clear()
 
         # add any new torrents added on the server
         # and update all torrents
         # this dictionary of torrents will only contain the data changed since last update
         for torrent_hash, torrent in torrents.items():
-            torrent_row_w = self.torrent_row_store.get(torrent_hash)
-            # add a Torrent Row for new torrents
-            if torrent_row_w is None:
-                torrent_row_w = uw.AttrMap(
-                    TorrentRow(
-                        torrent_list_box_w=self.torrent_list_box_w,
-                        torrent_hash=torrent_hash,
-                        torrent=torrent,
-                    ),
-                    attr_map=self.color_scheme(torrent),
-                    focus_map="selected",
+            cached_torrent = self.torrent_store.get(torrent_hash)
+            if cached_torrent is None:
+                self.torrent_store[torrent_hash] = dict(torrent)
+                self._name_lengths.add(len(torrent.get("name", "")))
+                self._name_search.set(torrent_hash, torrent.get("name", ""))
+                self._set_facets(torrent_hash, torrent, self.FACETS.values())
+                self._insertion_seq[torrent_hash] = next(self._next_insertion_seq)
+                self._sort_keys[torrent_hash] = self._make_sort_key(
+                    torrent_hash, torrent
                 )
-                self.torrent_row_store[torrent_hash] = torrent_row_w
+                self._add_to_tabs(
+                    torrent_hash, self.status_tabs_for_state(torrent.get("state"))
+                )
+                self._add_to_view(torrent_hash)
             else:
+                self._remove_from_view(torrent_hash)
+                # note: torrent will only contain the "state" key if it changed
+                old_tabs = self.status_tabs_for_state(cached_torrent.get("state"))
+                new_tabs = self.status_tabs_for_state(
+                    torrent.get("state", cached_torrent.get("state"))
+                )
+                if "name" in torrent:
+                    self._name_lengths.replace(
+                        len(cached_torrent.get("name", "")), len(torrent["name"])
+                    )
+                    self._name_search.set(torrent_hash, torrent["name"])
+                cached_torrent.update(torrent)
+                self._set_facets(torrent_hash, cached_torrent, torrent)
+                if self._is_sort_key_changed(torrent_hash, cached_torrent):
+                    # move the torrent to its new position in each tab
+                    self._remove_from_tabs(torrent_hash, old_tabs)
+                    self._sort_keys[torrent_hash] = self._make_sort_key(
+                        torrent_hash, cached_torrent
+                    )
+                    self._add_to_tabs(torrent_hash, new_tabs)
+                elif old_tabs != new_tabs:
+                    self._remove_from_tabs(torrent_hash, old_tabs - new_tabs)
+                    self._add_to_tabs(torrent_hash, new_tabs - old_tabs)
+                self._add_to_view(torrent_hash)
+                # rows are brought up to date when they are next displayed
+                if torrent_hash in self._torrent_rows:
+                    pending = self._pending_row_updates.setdefault(torrent_hash, {})
+                    pending.update(torrent)
+
+        if focus_sort_key is not None and not full_update:
+            self._focus_in_place_of(focus_hash, focus_sort_key)
+
+    def _focus_in_place_of(self, torrent_hash: str, sort_key):
+        """If a torrent left the displayed list, focus the torrent now in its place."""
+        hashes = self.walker.hashes
+        if self.body is not self.walker or not hashes:
+            return
+        if self.position_of(torrent_hash) is None:
+            pos = bisect_left(hashes, sort_key, key=self._sort_key)
+            self.walker.set_focus(min(pos, len(hashes) - 1))
+
+    def get_torrent_row(self, torrent_hash: str):
+        """
+        Retrieve the row for a torrent, building it if necessary.
+
+        Only the most recently displayed rows are kept; a row is brought up to
+        date with the changes to its torrent and the list's current layout
+        when it is retrieved.
+
+        :param torrent_hash:
+        """
+        torrent_row_w = self._torrent_rows.get(torrent_hash)
+        if torrent_row_w is None:
+            torrent = self.torrent_store[torrent_hash]
+            torrent_row_w = uw.AttrMap(
+                self._row_class(
+                    torrent_list_box_w=self.torrent_list_box_w,
+                    torrent_hash=torrent_hash,
+                    torrent=torrent,
+                ),
+                attr_map=self.color_scheme(torrent),
+                focus_map="selected",
+            )
+            torrent_row_w.base_widget.update(torrent)
+            self._torrent_rows[torrent_hash] = torrent_row_w
+            if len(self._torrent_rows) > self._max_cached_rows:
+                evicted_hash, _ = self._torrent_rows.popitem(last=False)
+                self._pending_row_updates.pop(evicted_hash, None)
+        else:
+            self._torrent_rows.move_to_end(torrent_hash)
+            torrent = self._pending_row_updates.pop(torrent_hash, None)
+            if torrent is not None:
                 # check if row's current color scheme needs to be updated
                 # note: torrent will only contain the "state" key if it changed
                 curr_attr = torrent_row_w.attr_map.get(None)
                 new_attr = self.color_scheme(torrent)
                 if new_attr and curr_attr != new_attr:
                     torrent_row_w.attr_map = {None: new_attr}
-            # finally update the data for the torrent row
-            torrent_row_w.base_widget.update(torrent)
+                torrent_row_w.base_widget.update(torrent)
+
+        if self.row_sizing is not None:
+            torrent_row_w.base_widget.apply_layout(self.row_sizing, self.name_len)
+        return torrent_row_w
 
     @staticmethod
     def color_scheme(torrent: dict):
@@ -281,154 +745,177 @@ class TorrentList(uw.ListBox):
 
     def resize(self):
         """
-        Resize all torrent rows to screen width.
+        Determine the layout of the torrent rows for the screen width.
 
-        1) Determine longest torrent name 2) Resize all torrent names to
-        max name length 3) Determine widths of different sizings 4)
-        Apply largest sizing that fits
+        1) Determine longest torrent name 2) Determine widths of different
+        sizings 3) Use largest sizing that fits. The layout is shared by all
+        rows and each row is arranged for it as it's displayed; rows are
+        only redisplayed when the layout changes.
         """
         # torrent info width with graphic progress bar: 115
 
-        name_list = [
-            torrent_row_w.base_widget.cached_torrent["name"]
-            for torrent_row_w in self.torrent_row_store.values()
-        ]
-        if name_list:
+        if self.torrent_store:
             max_name_len = min(
-                int(config.get("TORRENT_LIST_MAX_TORRENT_NAME_LENGTH")),
-                max(map(len, name_list)),
+                config.settings.torrent_list_max_torrent_name_length,
+                self._name_lengths.max(),
             )
-            for torrent_row_w in self.torrent_row_store.values():
-                torrent_row_w.base_widget.resize_name_len(max_name_len)
         else:
             max_name_len = 50
 
         if self.torrent_list_box_w.width < (max_name_len + 80):
-            for torrent_row_w in self.torrent_row_store.values():
-                # resize torrent name to 0 (effectively hiding it)
-                #  name keeps resetting each time info is updated
-                torrent_row_w.base_widget.resize_name_len(0)
-                if torrent_row_w.base_widget.current_sizing != "narrow":
-                    # logger.info("Resizing %s to narrow" % torrent_row_w.base_widget.cached_torrent.name)
-                    # ensure we're using the pb text
-                    torrent_row_w.base_widget.swap_pb_bar_for_pb_text()
-                    # insert a blank space
-                    torrent_row_w.base_widget.torrent_row_columns_w.base_widget.contents.insert(
-                        0,
-                        (
-                            TorrentRowColumns.TorrentInfoColumnValueContainer(
-                                name="blank", raw_value=" ", format_func=str
-                            ),
-                            torrent_row_w.base_widget.torrent_row_columns_w.base_widget.options(
-                                uw.PACK, None, False
-                            ),
-                        ),
-                    )
-                    # add the torrent name as a new widget in the Pile for the TorrentRow
-                    torrent_row_w.base_widget.contents.insert(
-                        0,
-                        (
-                            uw.Padding(
-                                uw.Text(
-                                    torrent_row_w.base_widget.cached_torrent["name"]
-                                )
-                            ),
-                            ("pack", None),
-                        ),
-                    )
-                    torrent_row_w.base_widget.current_sizing = "narrow"
-
+            sizing = "narrow"
         elif self.torrent_list_box_w.width < (max_name_len + 115):
-            for torrent_row_w in self.torrent_row_store.values():
-                if torrent_row_w.base_widget.current_sizing != "pb_text":
-                    if torrent_row_w.base_widget.current_sizing == "narrow":
-                        torrent_row_w.base_widget.torrent_row_columns_w.base_widget.contents.pop(
-                            0
-                        )
-                        torrent_row_w.base_widget.contents.pop(0)
-                    # logger.info("Resizing %s to pb text" % torrent_row_w.base_widget.cached_torrent.name)
-                    torrent_row_w.base_widget.swap_pb_bar_for_pb_text()
-                    torrent_row_w.base_widget.base_widget.current_sizing = "pb_text"
-
+            sizing = "pb_text"
         else:
-            for torrent_row_w in self.torrent_row_store.values():
-                if torrent_row_w.base_widget.current_sizing != "pb_bar":
-                    if torrent_row_w.base_widget.current_sizing == "narrow":
-                        torrent_row_w.base_widget.torrent_row_columns_w.base_widget.contents.pop(
-                            0
-                        )
-                        torrent_row_w.base_widget.contents.pop(0)
-                    # logger.info("Resizing %s to pb bar" % torrent_row_w.base_widget.cached_torrent.name)
-                    torrent_row_w.base_widget.swap_pb_text_for_pb_bar()
-                    torrent_row_w.base_widget.current_sizing = "pb_bar"
-
-
-class TorrentRow(uw.Pile):
-    def __init__(self, torrent_list_box_w, torrent_hash: str, torrent: dict):
-        """
-        Build a row for the torrent list.
+            sizing = "pb_bar"
 
-        :param torrent_list_box_w:
-        :param torrent_hash:
-        :param torrent:
+        if (sizing, max_name_len) != (self.row_sizing, self.name_len):
+            self.row_sizing = sizing
+            self.name_len = max_name_len
+            self.walker.refresh()
+
+
+# unicode variation selectors
+VARIATION_SELECTORS = re_compile(r"[\uFE00-\uFE0F]")
+
+
+@lru_cache(maxsize=4096)
+def display_name(name: str, width: int = None):
+    """
+    Torrent name as it's displayed.
+
+    Names are cached for each width so a name is only prepared again when
+    the torrent is renamed or the layout of the torrent list changes.
+
+    :param name: name of the torrent
+    :param width: display width to clip or pad the name to; None to leave as is
+    """
+    name = VARIATION_SELECTORS.sub("", str(name))
+    if width is None:
+        return name
+    end, name_width = uw.calc_text_pos(name, 0, len(name), width)
+    return name[:end] + " " * (width - name_width)
+
+
+@lru_cache(maxsize=1024)
+def tracker_domain(tracker_url: str):
+    """Domain of a tracker's url or an empty string for no tracker."""
+    return urlsplit(tracker_url).hostname or ""
+
+
+@total_ordering
+class _Reversed:
+    """Sort key wrapper to sort values in descending order."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+
+class TorrentListWalker(uw.ListWalker):
+    def __init__(self, get_row, position_of):
         """
-        self._hash = None
-        self.torrent_list_box_w = torrent_list_box_w
-        self.main = torrent_list_box_w.main
+        List walker for torrent rows that only builds rows as they're displayed.
 
-        self.current_sizing = None
+        The list of torrents is changed in place as torrents are added,
+        removed, and re-sorted; so, the focused torrent is tracked by its hash
+        and its position is looked up when it's needed.
 
-        # TODO: stop caching the torrent
-        self.cached_torrent = torrent
+        :param get_row: function returning the row for a torrent hash
+        :param position_of: function returning the position of a torrent hash
+            in a list of torrent hashes (or None)
+        """
+        self._get_row = get_row
+        self._position_of = position_of
+        self.hashes = []
+        self.focus_hash = None
+        # position of the focused torrent when it was last looked up
+        self._focus_position = 0
+
+    def __len__(self):
+        return len(self.hashes)
+
+    def __getitem__(self, position):
+        if position < 0:
+            raise IndexError(position)
+        return self._get_row(self.hashes[position])
+
+    def next_position(self, position):
+        if position + 1 >= len(self.hashes):
+            raise IndexError(position)
+        return position + 1
+
+    def prev_position(self, position):
+        if position <= 0:
+            raise IndexError(position)
+        return position - 1
+
+    def positions(self, reverse=False):
+        if reverse:
+            return range(len(self.hashes) - 1, -1, -1)
+        return range(len(self.hashes))
 
-        # build empty Torrent Row
-        self.torrent_row_columns_w = TorrentRowColumns()
-        # store hash
-        self.set_torrent_hash(torrent_hash)
-        # build row widget
-        super().__init__([self.torrent_row_columns_w])
+    @property
+    def focus(self):
+        position = None
+        if self.focus_hash is not None:
+            position = self._position_of(self.focus_hash, self.hashes)
+        if position is None:
+            # the focused torrent left the list; focus the torrent in its place
+            position = min(self._focus_position, max(len(self.hashes) - 1, 0))
+            self.focus_hash = self.hashes[position] if self.hashes else None
+        self._focus_position = position
+        return position
+
+    def set_focus(self, position):
+        self.focus_hash = self.hashes[position] if position < len(self.hashes) else None
+        self._focus_position = position
+        self._modified()
+
+    def set_focus_hash(self, torrent_hash: str = None):
+        """Focus a torrent or the first torrent if it isn't in the list."""
+        position = None
+        if torrent_hash is not None:
+            position = self._position_of(torrent_hash, self.hashes)
+        if position is None:
+            torrent_hash = self.hashes[0] if self.hashes else None
+            position = 0
+        self.focus_hash = torrent_hash
+        self._focus_position = position
+        self._modified()
+
+    def get_focus_hash(self):
+        # looking up the focus also moves it off a torrent that left the list
+        _ = self.focus
+        return self.focus_hash
+
+    def set_hashes(self, hashes: list):
+        """
+        Replace the torrents in the list.
 
-    def update(self, torrent: dict):
-        self.cached_torrent.update(torrent)
-        self.torrent_row_columns_w.base_widget.update(torrent)
+        The list is used as-is; changes to it are displayed once the walker
+        is refreshed. The focused torrent stays focused if it's in the list.
 
-    def resize_name_len(self, name_length: int):
-        for i, w in enumerate(self.torrent_row_columns_w.base_widget.contents):
-            if hasattr(w[0], "name"):
-                if w[0].name == "name":
-                    self.torrent_row_columns_w.base_widget.contents[i] = (
-                        w[0],
-                        self.torrent_row_columns_w.base_widget.options(
-                            w[1][0], name_length, w[1][2]
-                        ),
-                    )
-        self.torrent_row_columns_w.base_widget.name_len = name_length
+        :param hashes: torrent hashes in display order
+        """
+        self.hashes = hashes
+        _ = self.focus
+        self._modified()
 
-    def swap_pb_bar_for_pb_text(self):
-        for i, w in enumerate(self.torrent_row_columns_w.base_widget.contents):
-            if hasattr(w[0], "name"):
-                if w[0].name == "pb":
-                    self.torrent_row_columns_w.base_widget.contents[i] = (
-                        self.torrent_row_columns_w.base_widget.pb_text_w,
-                        self.torrent_row_columns_w.base_widget.options(
-                            uw.GIVEN,
-                            len(self.torrent_row_columns_w.base_widget.pb_text_w),
-                            False,
-                        ),
-                    )
+    def refresh(self):
+        """Redisplay the rows after their torrents or layout changed."""
+        self._modified()
 
-    def swap_pb_text_for_pb_bar(self):
-        for i, w in enumerate(self.torrent_row_columns_w.base_widget.contents):
-            if hasattr(w[0], "name"):
-                if w[0].name == "pb_text":
-                    self.torrent_row_columns_w.base_widget.contents[i] = (
-                        self.torrent_row_columns_w.base_widget.pb_w,
-                        self.torrent_row_columns_w.base_widget.options(
-                            uw.GIVEN,
-                            int(config.get("TORRENT_LIST_PROGRESS_BAR_LENGTH")),
-                            False,
-                        ),
-                    )
+
+class TorrentRowActions:
+    """Key handling and windows shared by the torrent row renderers."""
 
     def set_torrent_hash(self, torrent_hash):
         self._hash = torrent_hash
@@ -485,94 +972,158 @@ class TorrentRow(uw.Pile):
         return key
 
 
-class TorrentRowColumns(uw.Columns):
-    def __init__(self):
-        self.wide = False
+class TorrentRow(TorrentRowActions, uw.Pile):
+    def __init__(self, torrent_list_box_w, torrent_hash: str, torrent: dict):
+        """
+        Build a row for the torrent list.
 
-        val_cont = TorrentRowColumns.TorrentInfoColumnValueContainer
-        pb_cont = TorrentRowColumns.TorrentInfoColumnPBContainer
+        :param torrent_list_box_w:
+        :param torrent_hash:
+        :param torrent:
+        """
+        self._hash = None
+        self.torrent_list_box_w = torrent_list_box_w
+        self.main = torrent_list_box_w.main
+
+        self.current_sizing = None
+
+        # TODO: stop caching the torrent
+        self.cached_torrent = torrent
+
+        # build empty Torrent Row
+        self.torrent_row_columns_w = TorrentRowColumns()
+        # store hash
+        self.set_torrent_hash(torrent_hash)
+        # build row widget
+        super().__init__([self.torrent_row_columns_w])
+
+    def update(self, torrent: dict):
+        self.cached_torrent.update(torrent)
+        self.torrent_row_columns_w.base_widget.update(torrent)
 
-        def format_title(v):
-            # strip unicode version selectors
-            v = re_sub(r"[\uFE00-\uFE0F]", "", v)
-            return str(v).ljust(int(config.get("TORRENT_LIST_MAX_TORRENT_NAME_LENGTH")))
+    def resize_name_len(self, name_length: int):
+        for i, w in enumerate(self.torrent_row_columns_w.base_widget.contents):
+            if hasattr(w[0], "name"):
+                if w[0].name == "name":
+                    self.torrent_row_columns_w.base_widget.contents[i] = (
+                        w[0],
+                        self.torrent_row_columns_w.base_widget.options(
+                            w[1][0], name_length, w[1][2]
+                        ),
+                    )
+        self.torrent_row_columns_w.base_widget.name_len = name_length
 
-        self.name_w = val_cont(name="name", raw_value="", format_func=format_title)
+    def apply_layout(self, sizing: str, name_len: int):
+        """
+        Arrange the row for the layout of the torrent list.
 
-        def format_state(v):
-            return STATE_MAP_FOR_DISPLAY.get(v, v).ljust(12)
+        :param sizing: "narrow", "pb_text" or "pb_bar"
+        :param name_len: width for the torrent name
+        """
+        columns_w = self.torrent_row_columns_w.base_widget
+        if sizing == "narrow":
+            # resize torrent name to 0 (effectively hiding it)
+            name_len = 0
+        if columns_w.name_len != name_len:
+            self.resize_name_len(name_len)
+
+        if self.current_sizing == sizing:
+            return
+        if self.current_sizing == "narrow":
+            columns_w.contents.pop(0)
+            self.contents.pop(0)
+
+        if sizing == "narrow":
+            # ensure we're using the pb text
+            self.swap_pb_bar_for_pb_text()
+            # insert a blank space
+            columns_w.contents.insert(
+                0,
+                (
+                    TorrentRowColumns.TorrentInfoColumnValueContainer(
+                        name="blank", raw_value=" ", format_func=str
+                    ),
+                    columns_w.options(uw.PACK, None, False),
+                ),
+            )
+            # add the torrent name as a new widget in the Pile for the TorrentRow
+            self.contents.insert(
+                0,
+                (uw.Padding(uw.Text(self.cached_torrent["name"])), ("pack", None)),
+            )
+        elif sizing == "pb_text":
+            self.swap_pb_bar_for_pb_text()
+        else:
+            self.swap_pb_text_for_pb_bar()
+        self.current_sizing = sizing
 
-        self.state_w = val_cont(name="state", raw_value="", format_func=format_state)
+    def swap_pb_bar_for_pb_text(self):
+        for i, w in enumerate(self.torrent_row_columns_w.base_widget.contents):
+            if hasattr(w[0], "name"):
+                if w[0].name == "pb":
+                    self.torrent_row_columns_w.base_widget.contents[i] = (
+                        self.torrent_row_columns_w.base_widget.pb_text_w,
+                        self.torrent_row_columns_w.base_widget.options(
+                            uw.GIVEN,
+                            len(self.torrent_row_columns_w.base_widget.pb_text_w),
+                            False,
+                        ),
+                    )
+
+    def swap_pb_text_for_pb_bar(self):
+        for i, w in enumerate(self.torrent_row_columns_w.base_widget.contents):
+            if hasattr(w[0], "name"):
+                if w[0].name == "pb_text":
+                    self.torrent_row_columns_w.base_widget.contents[i] = (
+                        self.torrent_row_columns_w.base_widget.pb_w,
+                        self.torrent_row_columns_w.base_widget.options(
+                            uw.GIVEN,
+                            config.settings.torrent_list_progress_bar_length,
+                            False,
+                        ),
+                    )
 
-        def format_size(v):
-            return natural_file_size(v, gnu=True).rjust(6)
 
-        self.size_w = val_cont(name="size", raw_value=0, format_func=format_size)
+class TorrentRowColumns(uw.Columns):
+    def __init__(self):
+        self.wide = False
+        self.name_len = None
 
-        def format_pb(v: DownloadProgressBar):
-            return v.get_percentage().rjust(4)
+        val_cont = TorrentRowColumns.TorrentInfoColumnValueContainer
+        pb_cont = TorrentRowColumns.TorrentInfoColumnPBContainer
 
+        self.name_w = val_cont(name="name", raw_value="", format_func=self.format_title)
+        self.state_w = val_cont(
+            name="state", raw_value="", format_func=self.format_state
+        )
+        self.size_w = val_cont(name="size", raw_value=0, format_func=self.format_size)
         self.pb_w = pb_cont(name="pb", current=0)
         self.pb_text_w = val_cont(
-            name="pb_text", raw_value=self.pb_w, format_func=format_pb
+            name="pb_text", raw_value=self.pb_w, format_func=self.format_pb
         )
-
-        def format_dl_speed(v):
-            return natural_file_size(v, gnu=True).rjust(6) + DOWN_TRIANGLE
-
         self.dl_speed_w = val_cont(
-            name="dlspeed", raw_value=0, format_func=format_dl_speed
+            name="dlspeed", raw_value=0, format_func=self.format_dl_speed
         )
-
-        def format_up_speed(v):
-            return natural_file_size(v, gnu=True).rjust(6) + UP_TRIANGLE
-
         self.up_speed_w = val_cont(
-            name="upspeed", raw_value=0, format_func=format_up_speed
+            name="upspeed", raw_value=0, format_func=self.format_up_speed
         )
-
-        def format_amt_uploaded(v):
-            return natural_file_size(v, gnu=True).rjust(6) + UP_ARROW
-
         self.amt_uploaded_w = val_cont(
-            name="uploaded", raw_value=0, format_func=format_amt_uploaded
+            name="uploaded", raw_value=0, format_func=self.format_amt_uploaded
+        )
+        self.ratio_w = val_cont(
+            name="ratio", raw_value=0, format_func=self.format_ratio
         )
-
-        def format_ratio(v):
-            return f"R {v:.2f}"
-
-        self.ratio_w = val_cont(name="ratio", raw_value=0, format_func=format_ratio)
-
-        def format_leech_num(v):
-            return f"L {v:3d}"
-
         self.leech_num_w = val_cont(
-            name="num_leechs", raw_value=0, format_func=format_leech_num
+            name="num_leechs", raw_value=0, format_func=self.format_leech_num
         )
-
-        def format_seed_num(v):
-            return f"S {v:3d}"
-
         self.seed_num_w = val_cont(
-            name="num_seeds", raw_value=0, format_func=format_seed_num
+            name="num_seeds", raw_value=0, format_func=self.format_seed_num
         )
-
-        def format_eta(v):
-            eta = pretty_time_delta(seconds=v) if v < SECS_INFINITY else INFINITY
-            # just use first unit from pretty time delta
-            with suppress(StopIteration):
-                eta = eta[: next(i for i, c in enumerate(eta) if not c.isnumeric()) + 1]
-            return f"ETA {eta.rjust(3)}"[:7]
-
         self.eta_w = val_cont(
-            name="eta", raw_value=SECS_INFINITY, format_func=format_eta
+            name="eta", raw_value=SECS_INFINITY, format_func=self.format_eta
         )
-
-        def format_category(v):
-            return str(v)
-
         self.category_w = val_cont(
-            name="category", raw_value="", format_func=format_category
+            name="category", raw_value="", format_func=self.format_category
         )
 
         self.pb_info_list = [
@@ -581,7 +1132,7 @@ class TorrentRowColumns(uw.Columns):
             # size
             (len(self.size_w), self.size_w),
             # progress percentage
-            (int(config.get("TORRENT_LIST_PROGRESS_BAR_LENGTH")), self.pb_w),
+            (config.settings.torrent_list_progress_bar_length, self.pb_w),
             # dl speed
             (len(self.dl_speed_w), self.dl_speed_w),
             # up speed
@@ -598,7 +1149,9 @@ class TorrentRowColumns(uw.Columns):
             (len(self.eta_w), self.eta_w),
         ]
 
-        self.pb_full_info_list = [(len(self.name_w), self.name_w)]
+        self.pb_full_info_list = [
+            (config.settings.torrent_list_max_torrent_name_length, self.name_w)
+        ]
         self.pb_full_info_list.extend(self.pb_info_list)
         self.pb_full_info_list.append(self.category_w)
 
@@ -606,6 +1159,26 @@ class TorrentRowColumns(uw.Columns):
         self.text_pb_info_list.pop(3)
         self.text_pb_info_list.insert(3, (len(self.pb_text_w), self.pb_text_w))
 
+        # cells to update for each key in the torrent data; the progress
+        # percentage text updates the progress bar as well
+        self.cells_by_key = {}
+        for cell in (
+            self.name_w,
+            self.state_w,
+            self.size_w,
+            self.dl_speed_w,
+            self.up_speed_w,
+            self.amt_uploaded_w,
+            self.ratio_w,
+            self.leech_num_w,
+            self.seed_num_w,
+            self.eta_w,
+            self.category_w,
+        ):
+            self.cells_by_key[cell.name] = [cell]
+        self.cells_by_key["size"].append(self.pb_text_w)
+        self.cells_by_key["completed"] = [self.pb_text_w]
+
         super().__init__(
             self.pb_full_info_list,
             dividechars=1,
@@ -615,9 +1188,65 @@ class TorrentRowColumns(uw.Columns):
         )
 
     def update(self, torrent: dict):
-        for w in self.contents:
-            e = w[0]
-            e.update(torrent)
+        """
+        Update the cells for the data that changed.
+
+        Cells whose text doesn't change aren't touched so the row can be
+        redisplayed without being rendered again.
+
+        :param torrent: changed torrent data
+        """
+        cells = {}
+        for key in torrent:
+            cells.update(dict.fromkeys(self.cells_by_key.get(key, ())))
+        for cell in cells:
+            cell.update(torrent)
+
+    @staticmethod
+    def format_title(v):
+        return display_name(v)
+
+    @staticmethod
+    def format_state(v):
+        return STATE_MAP_FOR_DISPLAY.get(v, v).ljust(12)
+
+    @staticmethod
+    def format_size(v):
+        return natural_file_size(v, gnu=True).rjust(6)
+
+    @staticmethod
+    def format_pb(v: DownloadProgressBar):
+        return v.get_percentage().rjust(4)
+
+    @staticmethod
+    def format_dl_speed(v):
+        return natural_file_size(v, gnu=True).rjust(6) + DOWN_TRIANGLE
+
+    @staticmethod
+    def format_up_speed(v):
+        return natural_file_size(v, gnu=True).rjust(6) + UP_TRIANGLE
+
+    @staticmethod
+    def format_amt_uploaded(v):
+        return natural_file_size(v, gnu=True).rjust(6) + UP_ARROW
+
+    @staticmethod
+    def format_ratio(v):
+        return f"R {v:.2f}"
+
+    @staticmethod
+    def format_leech_num(v):
+        return f"L {v:3d}"
+
+    @staticmethod
+    def format_seed_num(v):
+        return f"S {v:3d}"
+
+    format_eta = staticmethod(format_eta)
+
+    @staticmethod
+    def format_category(v):
+        return str(v)
 
     def keypress(self, size, key):
         """Ignore key presses by just returning key."""
@@ -644,7 +1273,10 @@ class TorrentRowColumns(uw.Columns):
         @raw_value.setter
         def raw_value(self, v):
             self._raw_value = v
-            self.set_text(self.format_func(v))
+            text = self.format_func(v)
+            # setting the text invalidates the row's rendering
+            if text != self.text:
+                self.set_text(text)
 
         def update(self, torrent: dict):
             if self.name == "blank":
@@ -653,7 +1285,7 @@ class TorrentRowColumns(uw.Columns):
                 self._raw_value.update(torrent)
                 self.raw_value = self._raw_value
             else:
-                if self.name in torrent:
+                if self.name in torrent and torrent[self.name] != self._raw_value:
                     self.raw_value = torrent[self.name]
 
     class TorrentInfoColumnPBContainer(DownloadProgressBar):
@@ -673,10 +1305,190 @@ class TorrentRowColumns(uw.Columns):
             return self.get_percentage().rjust(4)
 
         def update(self, torrent: dict):
-            if "completed" in torrent:
+            if "completed" in torrent and torrent["completed"] != self.current:
                 self.current = torrent["completed"]
             if "size" in torrent:
-                self.done = torrent["size"] if torrent["size"] != 0 else 100
+                done = torrent["size"] if torrent["size"] != 0 else 100
+                if done != self.done:
+                    self.done = done
+
+
+class TorrentTextRow(TorrentRowActions, SelectableText):
+    def __init__(self, torrent_list_box_w, torrent_hash: str, torrent: dict):
+        """
+        Build a row for the torrent list as a single text widget.
+
+        Each column is formatted to its width only when its data changes and
+        the columns are joined in to lines for the list's layout; the
+        progress bar is drawn as attributes on the line's characters.
+
+        :param torrent_list_box_w:
+        :param torrent_hash:
+        :param torrent:
+        """
+        self._hash = None
+        self.torrent_list_box_w = torrent_list_box_w
+        self.main = torrent_list_box_w.main
+
+        self.current_sizing = "pb_bar"
+        self.name_len = config.settings.torrent_list_max_torrent_name_length
+        self.pb_len = config.settings.torrent_list_progress_bar_length
+
+        # TODO: stop caching the torrent
+        self.cached_torrent = torrent
+
+        self.cells = {}
+        self.markup = None
+        self.set_torrent_hash(torrent_hash)
+        super().__init__("", wrap=uw.CLIP)
+
+    def update(self, torrent: dict):
+        self.cached_torrent.update(torrent)
+        for cell, (keys, format_func, width) in self.cell_formats(self.pb_len).items():
+            if cell in self.cells and keys.keys().isdisjoint(torrent):
+                continue
+            text = format_func(
+                *(self.cached_torrent.get(k, d) for k, d in keys.items())
+            )
+            self.cells[cell] = text if width is None else text[:width].ljust(width)
+        self.render_text()
+
+    def apply_layout(self, sizing: str, name_len: int):
+        """
+        Arrange the row for the layout of the torrent list.
+
+        :param sizing: "narrow", "pb_text" or "pb_bar"
+        :param name_len: width for the torrent name
+        """
+        if (sizing, name_len) != (self.current_sizing, self.name_len):
+            self.current_sizing = sizing
+            self.name_len = name_len
+            self.render_text()
+
+    def render_text(self):
+        """Lay out the row's text; the text is only set when it changes."""
+        cells, pb_offset = self.cell_layout(self.current_sizing)
+        if self.current_sizing == "narrow":
+            # torrent name on its own line above the rest of the columns
+            head = display_name(self.cells["name"]) + "\n  "
+        else:
+            head = display_name(self.cells["name"], self.name_len) + " "
+        line = head + " ".join([self.cells[cell] for cell in cells])
+
+        if pb_offset is None:
+            markup = [line]
+        else:
+            start = len(head) + pb_offset
+            end = start + self.pb_len
+            complete = start + self.pb_complete_len(self.cached_torrent, self.pb_len)
+            markup = [
+                run
+                for run in (
+                    line[:start],
+                    ("pg complete", line[start:complete]),
+                    ("pg normal", line[complete:end]),
+                    line[end:],
+                )
+                if run and run[-1]
+            ]
+        if markup != self.markup:
+            self.markup = markup
+            self.set_text(markup)
+
+    @staticmethod
+    def format_percentage(current, size):
+        done = size if size != 0 else 100
+        return f"{int(current * 100 / done)}%".rjust(4)
+
+    @staticmethod
+    def format_pb_bar(current, size, width: int):
+        """Progress bar text centered like DownloadProgressBar."""
+        percent = TorrentTextRow.format_percentage(current, size).lstrip()
+        text = natural_file_size(current, gnu=True).rjust(7)
+        text += (" (" + percent + ")").ljust(6)
+        return " " * ((width - len(text) + 1) // 2) + text
+
+    @staticmethod
+    def pb_complete_len(torrent: dict, width: int):
+        """Number of characters of the progress bar drawn as complete."""
+        size = torrent.get("size", 0)
+        done = size if size != 0 else 100
+        return max(0, min(width, int(torrent.get("completed", 0) * width / done)))
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def cell_formats(pb_len: int):
+        """
+        Formatting for each column of a row.
+
+        :param pb_len: width of the progress bar
+        :return: torrent data (with defaults) a column is formatted from, its
+            formatter and its width; None for no fixed width
+        """
+        fmt = TorrentRowColumns
+        return {
+            "name": (dict(name=""), str, None),
+            "state": (dict(state=""), fmt.format_state, len(fmt.format_state(""))),
+            "size": (dict(size=0), fmt.format_size, len(fmt.format_size(0))),
+            "pb": (
+                dict(completed=0, size=0),
+                lambda current, size: TorrentTextRow.format_pb_bar(
+                    current, size, pb_len
+                ),
+                pb_len,
+            ),
+            "pb_text": (dict(completed=0, size=0), TorrentTextRow.format_percentage, 4),
+            "dlspeed": (
+                dict(dlspeed=0),
+                fmt.format_dl_speed,
+                len(fmt.format_dl_speed(0)),
+            ),
+            "upspeed": (
+                dict(upspeed=0),
+                fmt.format_up_speed,
+                len(fmt.format_up_speed(0)),
+            ),
+            "uploaded": (
+                dict(uploaded=0),
+                fmt.format_amt_uploaded,
+                len(fmt.format_amt_uploaded(0)),
+            ),
+            "ratio": (dict(ratio=0), fmt.format_ratio, len(fmt.format_ratio(0))),
+            "num_seeds": (
+                dict(num_seeds=0),
+                fmt.format_seed_num,
+                len(fmt.format_seed_num(0)),
+            ),
+            "num_leechs": (
+                dict(num_leechs=0),
+                fmt.format_leech_num,
+                len(fmt.format_leech_num(0)),
+            ),
+            "eta": (
+                dict(eta=SECS_INFINITY),
+                fmt.format_eta,
+                len(fmt.format_eta(SECS_INFINITY)),
+            ),
+            "category": (dict(category=""), fmt.format_category, None),
+        }
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def cell_layout(sizing: str):
+        """
+        Columns following the torrent name for a layout.
+
+        :return: the columns and the offset of the progress bar from the
+            start of the columns; None if there is no progress bar
+        """
+        cells = ["state", "size", "pb" if sizing == "pb_bar" else "pb_text"]
+        cells.extend(("dlspeed", "upspeed", "uploaded", "ratio"))
+        cells.extend(("num_seeds", "num_leechs", "eta", "category"))
+        pb_offset = None
+        if sizing == "pb_bar":
+            formats = TorrentTextRow.cell_formats(0)
+            pb_offset = sum(formats[cell][2] + 1 for cell in cells[:2])
+        return tuple(cells), pb_offset
 
 
 class TorrentListTabsColumns(uw.Columns):
@@ -989,24 +1801,34 @@ class TorrentOptionsDialog(uw.ListBox):
             new_download_rate_limit = self.original_download_rate_limit
         new_category = self.category_w.selected_label
 
+        futures = []
+
         if new_location != self.original_location:
             logger.info(
                 "Setting new location: %s (%s)", new_location, self.torrent_hash
             )
-            self.client.torrents_set_location(
-                location=new_location, torrent_ids=self.torrent_hash
+            futures.append(
+                self.client.torrents_set_location(
+                    location=new_location, torrent_ids=self.torrent_hash
+                )
             )
 
         if new_name != self.original_name:
             logger.info("Setting new name: %s (%s)", new_name, self.torrent_hash)
-            self.client.torrent_rename(new_name=new_name, torrent_id=self.torrent_hash)
+            futures.append(
+                self.client.torrent_rename(
+                    new_name=new_name, torrent_id=self.torrent_hash
+                )
+            )
 
         if new_autotmm_state is not self.original_autotmm_state:
             logger.info(
                 "Setting Auto TMM: %s (%s)", new_autotmm_state, self.torrent_hash
             )
-            self.client.torrents_set_automatic_torrent_management(
-                enable=new_autotmm_state, torrent_ids=self.torrent_hash
+            futures.append(
+                self.client.torrents_set_automatic_torrent_management(
+                    enable=new_autotmm_state, torrent_ids=self.torrent_hash
+                )
             )
 
         if new_super_seeding_state is not self.original_super_seeding_state:
@@ -1015,8 +1837,10 @@ class TorrentOptionsDialog(uw.ListBox):
                 new_super_seeding_state,
                 self.torrent_hash,
             )
-            self.client.torrents_set_super_seeding(
-                enable=new_super_seeding_state, torrent_ids=self.torrent_hash
+            futures.append(
+                self.client.torrents_set_super_seeding(
+                    enable=new_super_seeding_state, torrent_ids=self.torrent_hash
+                )
             )
 
         if new_upload_rate_limit != self.original_upload_rate_limit:
@@ -1025,8 +1849,10 @@ class TorrentOptionsDialog(uw.ListBox):
                 new_upload_rate_limit,
                 self.torrent_hash,
             )
-            self.client.torrents_set_upload_limit(
-                limit=new_upload_rate_limit, torrent_ids=self.torrent_hash
+            futures.append(
+                self.client.torrents_set_upload_limit(
+                    limit=new_upload_rate_limit, torrent_ids=self.torrent_hash
+                )
             )
 
         if new_download_rate_limit != self.original_download_rate_limit:
@@ -1035,8 +1861,10 @@ class TorrentOptionsDialog(uw.ListBox):
                 new_download_rate_limit,
                 self.torrent_hash,
             )
-            self.client.torrents_set_download_limit(
-                limit=new_download_rate_limit, torrent_ids=self.torrent_hash
+            futures.append(
+                self.client.torrents_set_download_limit(
+                    limit=new_download_rate_limit, torrent_ids=self.torrent_hash
+                )
             )
 
         if new_category != self.original_category:
@@ -1045,36 +1873,42 @@ class TorrentOptionsDialog(uw.ListBox):
             logger.info(
                 "Setting new category: %s (%s)", new_category, self.torrent_hash
             )
-            self.client.torrents_set_category(
-                category=new_category, torrent_ids=self.torrent_hash
+            futures.append(
+                self.client.torrents_set_category(
+                    category=new_category, torrent_ids=self.torrent_hash
+                )
             )
 
         if new_share_ratio != self.original_share_ratio:
             if new_share_ratio in [-1, -2]:
-                self.client.torrents_set_share_limits(
-                    ratio_limit=new_share_ratio,
-                    seeding_time_limit=new_share_ratio,
-                    torrent_ids=self.torrent_hash,
+                futures.append(
+                    self.client.torrents_set_share_limits(
+                        ratio_limit=new_share_ratio,
+                        seeding_time_limit=new_share_ratio,
+                        torrent_ids=self.torrent_hash,
+                    )
                 )
             else:
-                self.client.torrents_set_share_limits(
-                    ratio_limit=new_share_ratio_percentage,
-                    seeding_time_limit=new_share_ratio_minutes,
-                    torrent_ids=self.torrent_hash,
+                futures.append(
+                    self.client.torrents_set_share_limits(
+                        ratio_limit=new_share_ratio_percentage,
+                        seeding_time_limit=new_share_ratio_minutes,
+                        torrent_ids=self.torrent_hash,
+                    )
                 )
 
-        self.reset_screen_to_torrent_list_window()
+        self.reset_screen_to_torrent_list_window(futures=futures)
 
     def close_window(self, b=None):
         self.reset_screen_to_torrent_list_window()
 
     def resume_torrent(self, b):
-        self.client.torrents_resume(torrent_ids=self.torrent_hash)
-        self.reset_screen_to_torrent_list_window()
+        future = self.client.torrents_resume(torrent_ids=self.torrent_hash)
+        self.reset_screen_to_torrent_list_window(futures=[future])
 
     def force_resume_torrent(self, b):
-        self.client.torrents_force_resume(torrent_ids=self.torrent_hash)
-        self.reset_screen_to_torrent_list_window()
+        future = self.client.torrents_force_resume(torrent_ids=self.torrent_hash)
+        self.reset_screen_to_torrent_list_window(futures=[future])
 
     def delete_torrent(self, b):
         self.delete_files_w = uw.CheckBox(label="Delete Files")
@@ -1127,30 +1961,51 @@ class TorrentOptionsDialog(uw.ListBox):
 
     def confirm_delete(self, b):
         delete_files = self.delete_files_w.get_state()
-        self.client.torrents_delete(
+        future = self.client.torrents_delete(
             torrent_ids=self.torrent_hash, delete_files=delete_files
         )
-        self.reset_screen_to_torrent_list_window()
+        self.reset_screen_to_torrent_list_window(futures=[future])
 
     def close_delete_dialog(self, b):
         self.main.loop.widget = self.main.app_window
 
     def pause_torrent(self, b):
-        self.client.torrents_pause(torrent_ids=self.torrent_hash)
-        self.reset_screen_to_torrent_list_window()
+        future = self.client.torrents_pause(torrent_ids=self.torrent_hash)
+        self.reset_screen_to_torrent_list_window(futures=[future])
 
     def recheck_torrent(self, b):
-        self.client.torrents_recheck(torrent_ids=self.torrent_hash)
-        self.reset_screen_to_torrent_list_window()
+        future = self.client.torrents_recheck(torrent_ids=self.torrent_hash)
+        self.reset_screen_to_torrent_list_window(futures=[future])
 
     def reannounce_torrent(self, b):
-        self.client.torrents_reannounce(torrent_ids=self.torrent_hash)
-        self.reset_screen_to_torrent_list_window()
+        future = self.client.torrents_reannounce(torrent_ids=self.torrent_hash)
+        self.reset_screen_to_torrent_list_window(futures=[future])
 
-    def reset_screen_to_torrent_list_window(self):
-        update_torrent_list_now.send("torrent menu")
+    def reset_screen_to_torrent_list_window(self, futures: list = None):
+        """
+        Return to the torrent list.
+
+        The torrent list is synced by the daemon as each command completes;
+        the futures for the commands are only watched here to log failures.
+
+        :param futures: futures for the commands sent from the menu
+        """
+        futures = [f for f in futures or [] if f is not None]
+        if futures:
+            for future in futures:
+                future.add_done_callback(self._log_command_failure)
+        else:
+            update_torrent_list_now.send("torrent menu")
         self.main.loop.widget = self.main.app_window
 
+    def _log_command_failure(self, future):
+        if not future.cancelled() and future.exception() is not None:
+            logger.info(
+                "Command for torrent %s failed: %r",
+                self.torrent_hash,
+                future.exception(),
+            )
+
 
 class TorrentAddDialog(uw.ListBox):
     def __init__(self, main):
@@ -1307,3 +2162,91 @@ class TorrentAddDialog(uw.ListBox):
     def reset_screen_to_torrent_list_window(self):
         update_torrent_list_now.send("torrent add")
         self.main.loop.widget = self.main.app_window
+
+
+class TorrentFacetDialog(uw.ListBox):
+    def __init__(self, torrent_list_box_w: TorrentListWindow):
+        """
+        Dialog to filter the torrent list by category, tag, or tracker.
+
+        The counts are refreshed while the dialog is open as torrents change.
+
+        :param torrent_list_box_w:
+        """
+        self.torrent_list_box_w = torrent_list_box_w
+        self.main = torrent_list_box_w.main
+        # (facet, value) for each row in the walker; None for headers and dividers
+        self._facet_values = []
+        self._is_counts_stale = False
+
+        super().__init__(uw.SimpleFocusListWalker([]))
+        self.update_counts()
+
+        server_torrents_changed.connect(receiver=self.counts_changed)
+
+    def counts_changed(self, sender, **kwargs):
+        """Refresh the counts the next time the dialog is rendered."""
+        # by then, the torrent list has applied the changes to its facet index
+        self._is_counts_stale = True
+        self._invalidate()
+
+    def render(self, size, focus=False):
+        if self._is_counts_stale:
+            self._is_counts_stale = False
+            self.update_counts()
+        return super().render(size, focus)
+
+    def update_counts(self):
+        """Rebuild the facet buttons from the torrent list's current counts."""
+        torrent_list_w = self.torrent_list_box_w.torrent_list_w
+        focused_facet_value = None
+        if self._facet_values:
+            focused_facet_value = self._facet_values[self.focus_position]
+
+        walker_list = [self._facet_button("All torrents", None, None), uw.Divider()]
+        facet_values = [(None, None), None]
+        for facet in TorrentList.FACETS:
+            counts = torrent_list_w.facet_counts(facet)
+            if facet == "category":
+                # include categories without any torrents
+                for category in self.main.server.categories:
+                    counts.setdefault(category, 0)
+            walker_list.append(uw.Text(f"{facet.capitalize()}:"))
+            facet_values.append(None)
+            for value in sorted(counts, key=str.casefold):
+                label = f"{TorrentList.facet_label(facet, value)} ({counts[value]})"
+                walker_list.append(self._facet_button(label, facet, value))
+                facet_values.append((facet, value))
+            walker_list.append(uw.Divider())
+            facet_values.append(None)
+
+        self.body[:] = walker_list
+        self._facet_values = facet_values
+        if focused_facet_value in facet_values:
+            self.body.set_focus(facet_values.index(focused_facet_value))
+        else:
+            self.body.set_focus(0)
+
+    def _facet_button(self, label: str, facet: str, value: str):
+        return uw.AttrMap(
+            ButtonWithoutCursor(
+                label, on_press=self.apply_facet, user_data=(facet, value)
+            ),
+            "",
+            focus_map="selected",
+        )
+
+    def apply_facet(self, b, facet_value):
+        self.torrent_list_box_w.torrent_list_w.set_facet_filter(*facet_value)
+        self.close_window()
+
+    def keypress(self, size, key):
+        log_keypress(logger, self, key)
+        key = super().keypress(size, {"shift tab": "up", "tab": "down"}.get(key, key))
+        if key == "esc":
+            self.close_window()
+        return key
+
+    def close_window(self, b=None):
+        server_torrents_changed.disconnect(self.counts_changed)
+        self.main.loop.widget = self.main.app_window
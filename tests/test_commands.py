@@ -0,0 +1,233 @@
+from concurrent.futures import Future
+
+from qbittorrentui.daemon import Commands
+
+
+def torrents_pause(hashes):
+    return f"paused {hashes}"
+
+
+def torrents_resume(hashes):
+    return f"resumed {hashes}"
+
+
+def torrents_set_category(category, hashes):
+    return f"{category} {hashes}"
+
+
+def torrents_rename(new_torrent_name, hash):
+    return f"renamed {hash}"
+
+
+def command(func, future=None, **func_args):
+    return Commands.Command(func=func, func_args=func_args, future=future)
+
+
+def test_coalesce_batches_commands_for_the_same_function():
+    commands = Commands.coalesce(
+        [
+            command(torrents_pause, hashes="a"),
+            command(torrents_pause, hashes="b|c"),
+            command(torrents_pause, hashes="a"),
+        ]
+    )
+
+    assert len(commands) == 1
+    assert commands[0].func_args == {"hashes": "a|b|c"}
+
+
+def test_coalesce_keeps_commands_for_a_torrent_in_order():
+    commands = Commands.coalesce(
+        [
+            command(torrents_pause, hashes="a"),
+            command(torrents_resume, hashes="a"),
+            command(torrents_pause, hashes="a|b"),
+        ]
+    )
+
+    assert [(c.name, c.func_args["hashes"]) for c in commands] == [
+        ("torrents_pause", "a"),
+        ("torrents_resume", "a"),
+        ("torrents_pause", "a|b"),
+    ]
+
+
+def test_coalesce_does_not_batch_different_arguments():
+    commands = Commands.coalesce(
+        [
+            command(torrents_set_category, category="x", hashes="a"),
+            command(torrents_set_category, category="y", hashes="b"),
+            command(torrents_set_category, category="x", hashes="c"),
+        ]
+    )
+
+    assert [c.func_args for c in commands] == [
+        {"category": "x", "hashes": "a|c"},
+        {"category": "y", "hashes": "b"},
+    ]
+
+
+def test_coalesce_drops_duplicates_of_unbatchable_commands():
+    commands = Commands.coalesce(
+        [
+            command(torrents_rename, new_torrent_name="n", hash="a"),
+            command(torrents_rename, new_torrent_name="n", hash="a"),
+            command(torrents_rename, new_torrent_name="m", hash="b"),
+        ]
+    )
+
+    assert [c.func_args["hash"] for c in commands] == ["a", "b"]
+
+
+def test_all_torrents_conflicts_with_any_torrent():
+    all_command = command(torrents_pause, hashes="all")
+    torrent_command = command(torrents_resume, hashes="a")
+
+    assert all_command.conflicts_with(torrent_command)
+    assert torrent_command.conflicts_with(all_command)
+    assert not command(torrents_pause, hashes="a").conflicts_with(
+        command(torrents_pause, hashes="b")
+    )
+    # commands for every torrent aren't batched with commands for some torrents
+    assert not all_command.absorb(command(torrents_pause, hashes="b"))
+
+
+def test_absorbed_commands_resolve_every_future():
+    futures = [Future(), Future()]
+    commands = Commands.coalesce(
+        [
+            command(torrents_pause, future=futures[0], hashes="a"),
+            command(torrents_pause, future=futures[1], hashes="b"),
+        ]
+    )
+
+    commands[0].set_result("ok")
+
+    assert [f.result(timeout=0) for f in futures] == ["ok", "ok"]
+
+
+def test_blocked_batch_splits_off_the_torrents_that_can_run():
+    batch = command(torrents_pause, hashes="a|b|c")
+
+    assert batch.is_blocked_by({"b"})
+    ready = batch.split_off({"b"})
+
+    assert batch.func_args == {"hashes": "b"}
+    assert ready.func_args == {"hashes": "a|c"}
+    assert batch.queued_time == ready.queued_time
+
+
+def test_split_off_only_splits_batches_with_free_torrents():
+    assert command(torrents_pause, hashes="a|b").split_off({"a", "b"}) is None
+    assert command(torrents_pause, hashes="a|b").split_off(set()) is None
+    assert (
+        command(torrents_rename, new_torrent_name="n", hash="a").split_off({"b"})
+        is None
+    )
+
+
+def test_commands_without_torrents_are_ordered_by_function():
+    def app_set_preferences(prefs):
+        return prefs
+
+    prefs_command = command(app_set_preferences, prefs={})
+
+    assert prefs_command.ordering_keys == {"app_set_preferences"}
+    assert prefs_command.is_blocked_by({"app_set_preferences"})
+    assert not prefs_command.is_blocked_by({"a"})
+    assert command(torrents_pause, hashes="all").is_blocked_by({"a"})
+    assert command(torrents_pause, hashes="a").is_blocked_by({"all"})
+
+
+def test_split_off_hands_over_futures():
+    free_future, kept_future = Future(), Future()
+    batch = Commands.coalesce(
+        [
+            command(torrents_pause, future=free_future, hashes="a"),
+            command(torrents_pause, future=kept_future, hashes="b"),
+        ]
+    )[0]
+    ready = batch.split_off({"b"})
+
+    ready.set_result("a done")
+    assert free_future.result(timeout=0) == "a done"
+    assert not kept_future.done()
+
+    batch.set_result("b done")
+    assert kept_future.result(timeout=0) == "b done"
+
+
+def test_split_future_waits_on_both_halves():
+    future = Future()
+    batch = command(torrents_pause, future=future, hashes="a|b")
+    ready = batch.split_off({"b"})
+
+    ready.set_result("a done")
+    assert not future.done()
+
+    batch.set_result("b done")
+    assert future.result(timeout=0) == "b done"
+
+
+def test_split_future_takes_the_first_error():
+    future = Future()
+    batch = command(torrents_pause, future=future, hashes="a|b")
+    ready = batch.split_off({"b"})
+
+    error = RuntimeError("a failed")
+    ready.set_exception(error)
+    batch.set_result("b done")
+
+    assert future.exception(timeout=0) is error
+
+
+def test_split_future_is_cancelled_with_either_half():
+    future = Future()
+    batch = command(torrents_pause, future=future, hashes="a|b")
+    ready = batch.split_off({"b"})
+
+    ready.cancel()
+    batch.set_result("b done")
+
+    assert future.cancelled()
+
+
+def test_nothing_overtakes_a_command_for_all_torrents():
+    commands = Commands(torrent_client=None)
+    submitted = []
+    commands._submit = submitted.append
+    try:
+        commands.run_command(
+            "test", torrents_set_category, dict(category="c", hashes="a")
+        )
+        commands._one_loop()
+        assert [c.name for c in submitted] == ["torrents_set_category"]
+
+        # set category is still running for torrent a
+        commands.run_command("test", torrents_pause, dict(hashes="all"))
+        commands.run_command("test", torrents_resume, dict(hashes="a|b"))
+        commands._one_loop()
+
+        # pause waits on set category and resume b must wait on pause
+        assert [c.name for c in submitted] == ["torrents_set_category"]
+        assert [c.func_args for c in commands._pending_commands] == [
+            {"hashes": "all"},
+            {"hashes": "a|b"},
+        ]
+    finally:
+        commands.stop("test")
+
+
+def test_only_commands_that_change_files_make_content_stale():
+    def torrents_file_priority(hash, file_ids, priority):
+        return None
+
+    def torrents_recheck(hashes):
+        return None
+
+    assert command(
+        torrents_file_priority, hash="a", file_ids=[0], priority=1
+    ).changes_content
+    assert command(torrents_recheck, hashes="a|b").changes_content
+    assert not command(torrents_pause, hashes="a").changes_content
+    assert not command(torrents_set_category, category="c", hashes="a").changes_content
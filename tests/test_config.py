@@ -0,0 +1,23 @@
+from qbittorrentui.config import Configuration, Settings
+
+
+def test_invalid_setting_falls_back_to_default(caplog):
+    configuration = Configuration()
+    configuration.read_string("[server]\nHTTP_RETRIES = three\nHTTP_READ_TIMEOUT = 5\n")
+
+    settings = Settings.from_config(configuration, section="server")
+
+    assert settings.http_retries == configuration.settings.http_retries
+    assert settings.http_read_timeout == 5
+    assert "HTTP_RETRIES" in caplog.text
+    assert "server" in caplog.text
+
+
+def test_invalid_setting_in_default_section_does_not_break_configuration(caplog):
+    configuration = Configuration()
+    configuration.set("HTTP_RETRIES", "three")
+
+    configuration.refresh_settings()
+
+    assert isinstance(configuration.settings.http_retries, int)
+    assert "DEFAULT" in caplog.text
@@ -0,0 +1,190 @@
+import os
+
+import pytest
+
+from qbittorrentui.daemon import (
+    DaemonSignal,
+    DaemonSignalQueue,
+    SyncMainData,
+    SyncTorrent,
+)
+
+
+def maindata(**md):
+    return SyncMainData.MainData(md)
+
+
+def test_merge_folds_torrent_changes_in_to_one_delta():
+    md = maindata(rid=1, torrents={"a": {"name": "a", "dlspeed": 1}})
+    md.merge(maindata(rid=2, torrents={"a": {"dlspeed": 2}, "b": {"name": "b"}}))
+
+    assert not md.full_update
+    assert md.torrents == {"a": {"name": "a", "dlspeed": 2}, "b": {"name": "b"}}
+    assert md.torrents_removed == []
+
+
+def test_merge_removal_drops_earlier_changes():
+    md = maindata(torrents={"a": {"name": "a"}, "b": {"name": "b"}})
+    md.merge(maindata(torrents_removed=["a"]))
+    md.merge(maindata(torrents_removed=["a"]))
+
+    assert md.torrents == {"b": {"name": "b"}}
+    assert md.torrents_removed == ["a"]
+
+
+def test_merge_removal_then_re_add_applies_both():
+    md = maindata(torrents_removed=["a"])
+    md.merge(maindata(torrents={"a": {"name": "new a"}}))
+
+    # the list applies removals before changes; so, the torrent is re-added
+    assert md.torrents_removed == ["a"]
+    assert md.torrents == {"a": {"name": "new a"}}
+
+
+def test_merge_in_to_full_update_stays_full_update():
+    md = maindata(full_update=True, torrents={"a": {"name": "a"}, "b": {"name": "b"}})
+    md.merge(maindata(torrents_removed=["a"], categories_removed=["c"]))
+
+    assert md.full_update
+    assert md.torrents == {"b": {"name": "b"}}
+    assert md.torrents_removed == []
+    assert md.categories_removed == []
+
+
+def test_merge_full_update_replaces_everything():
+    md = maindata(
+        torrents={"a": {"name": "a"}},
+        torrents_removed=["b"],
+        categories={"c": {"name": "c"}},
+        server_state={"dl_info_speed": 1},
+    )
+    md.merge(
+        maindata(
+            full_update=True,
+            torrents={"d": {"name": "d"}},
+            server_state={"up_info_speed": 2},
+        )
+    )
+
+    assert md.full_update
+    assert md.torrents == {"d": {"name": "d"}}
+    assert md.torrents_removed == []
+    assert md.categories == {}
+    assert md.server_state == {"up_info_speed": 2}
+
+
+def test_merge_categories():
+    md = maindata(categories={"c": {"name": "c", "savePath": "/a"}})
+    md.merge(maindata(categories={"c": {"savePath": "/b"}, "d": {"name": "d"}}))
+    md.merge(maindata(categories_removed=["d"]))
+
+    assert md.categories == {"c": {"name": "c", "savePath": "/b"}}
+    assert md.categories_removed == ["d"]
+    assert md.has_torrent_changes()
+    assert not maindata(server_state={"dl_info_speed": 1}).has_torrent_changes()
+
+
+@pytest.fixture
+def sync_torrent():
+    sync_torrent = SyncTorrent(torrent_client=None)
+    yield sync_torrent
+    sync_torrent.stop("test")
+
+
+def put_peers(sync_torrent, **sync_torrent_peers):
+    sync_torrent._put_torrent_store(
+        torrent_hash="t", sync_torrent_peers=sync_torrent_peers
+    )
+
+
+def test_take_peer_changes(sync_torrent):
+    assert sync_torrent.take_peer_changes("t") is None
+
+    put_peers(
+        sync_torrent,
+        full_update=True,
+        peers={"p1": {"client": "a", "dl_speed": 1}, "p2": {"client": "b"}},
+    )
+    assert sync_torrent.take_peer_changes("t") == dict(
+        full_update=True,
+        peers={"p1": {"client": "a", "dl_speed": 1}, "p2": {"client": "b"}},
+        peers_removed=[],
+    )
+
+    put_peers(sync_torrent, peers={"p1": {"dl_speed": 2}}, peers_removed=["p2"])
+    changes = sync_torrent.take_peer_changes("t")
+    assert changes == dict(
+        full_update=False,
+        peers={"p1": {"client": "a", "dl_speed": 2}},
+        peers_removed=["p2"],
+    )
+
+    # the changes are copies; so, the store can keep changing
+    changes["peers"]["p1"]["dl_speed"] = 3
+    assert sync_torrent.get_torrent_store("t").sync_torrent_peers["p1"]["dl_speed"] == 2
+
+    assert sync_torrent.take_peer_changes("t") == dict(
+        full_update=False, peers={}, peers_removed=[]
+    )
+
+
+def test_take_peer_changes_after_removal_and_re_add(sync_torrent):
+    put_peers(sync_torrent, full_update=True, peers={"p1": {"client": "a"}})
+    sync_torrent.take_peer_changes("t")
+
+    put_peers(sync_torrent, peers_removed=["p1"])
+    put_peers(sync_torrent, peers={"p1": {"client": "b", "dl_speed": 1}})
+    assert sync_torrent.take_peer_changes("t") == dict(
+        full_update=False,
+        peers={"p1": {"client": "b", "dl_speed": 1}},
+        peers_removed=[],
+    )
+
+    put_peers(sync_torrent, peers={"p2": {"client": "c"}})
+    put_peers(sync_torrent, peers_removed=["p2"])
+    assert sync_torrent.take_peer_changes("t") == dict(
+        full_update=False, peers={}, peers_removed=["p2"]
+    )
+
+
+def test_take_peer_changes_after_full_update(sync_torrent):
+    put_peers(sync_torrent, full_update=True, peers={"p1": {"client": "a"}})
+    sync_torrent.take_peer_changes("t")
+
+    put_peers(sync_torrent, peers_removed=["p1"])
+    put_peers(sync_torrent, full_update=True, peers={"p2": {"client": "b"}})
+    put_peers(sync_torrent, peers={"p2": {"dl_speed": 1}})
+    # everything since the full update is taken as one full update
+    assert sync_torrent.take_peer_changes("t") == dict(
+        full_update=True,
+        peers={"p2": {"client": "b", "dl_speed": 1}},
+        peers_removed=[],
+    )
+
+
+def test_signal_queue_keeps_signals_in_the_order_they_were_last_sent():
+    read_fd, write_fd = os.pipe()
+    try:
+        signals = DaemonSignalQueue(write_fd)
+        for signal, extra in [
+            ("connection_lost", None),
+            ("sync_torrent_data_ready", ["a"]),
+            ("connection_acquired", None),
+            ("sync_torrent_data_ready", ["b"]),
+            ("connection_lost", None),
+            ("sync_torrent_data_ready", ["a"]),
+        ]:
+            signals.put(DaemonSignal("test", signal, extra))
+
+        assert [(s.signal, s.extra) for s in signals.get_all()] == [
+            ("connection_acquired", ()),
+            ("sync_torrent_data_ready", ("b",)),
+            ("connection_lost", ()),
+            ("sync_torrent_data_ready", ("a",)),
+        ]
+        assert signals.get_all() == []
+        # the UI is only woken up once for all the queued signals
+        assert os.read(read_fd, 10) == b"\x00"
+    finally:
+        os.close(read_fd)
+        os.close(write_fd)
@@ -0,0 +1,141 @@
+import random
+from contextlib import suppress
+
+import pytest
+
+from qbittorrentui.config import INFINITY, SECS_INFINITY
+from qbittorrentui.formatters import (
+    format_eta,
+    natural_file_size,
+    natural_file_sizes,
+    pretty_time_delta,
+)
+
+# the formatters as they were before they were cached; the cached formatters
+# must produce exactly the same text
+
+
+def original_pretty_time_delta(seconds, spaces=False):
+    seconds = int(seconds)
+    days, seconds = divmod(seconds, 86400)
+    hours, seconds = divmod(seconds, 3600)
+    minutes, seconds = divmod(seconds, 60)
+    if days > 0:
+        ret = "%dd %dh" % (days, hours)
+    elif hours > 0:
+        ret = "%dh %dm" % (hours, minutes)
+    elif minutes > 0:
+        ret = "%dm %ds" % (minutes, seconds)
+    else:
+        ret = "%ds" % seconds
+    if spaces is False:
+        return ret.replace(" ", "")
+    return ret
+
+
+def original_format_eta(v):
+    eta = original_pretty_time_delta(seconds=v) if v < SECS_INFINITY else INFINITY
+    with suppress(StopIteration):
+        eta = eta[: next(i for i, c in enumerate(eta) if not c.isnumeric()) + 1]
+    return f"ETA {eta.rjust(3)}"[:7]
+
+
+def original_natural_file_size(value, binary=False, gnu=False, num_format="%.1f"):
+    suffixes = {
+        "decimal": ("kB", "MB", "GB", "TB", "PB", "EB", "ZB", "YB"),
+        "binary": ("KiB", "MiB", "GiB", "TiB", "PiB", "EiB", "ZiB", "YiB"),
+        "gnu": "KMGTPEZY",
+    }
+    if gnu:
+        suffix = suffixes["gnu"]
+    elif binary:
+        suffix = suffixes["binary"]
+    else:
+        suffix = suffixes["decimal"]
+
+    base = 1024 if (gnu or binary) else 1000
+    num_of_bytes = float(value)
+
+    if num_of_bytes == 1 and not gnu:
+        return "1 B"
+
+    if num_of_bytes < base and not gnu:
+        if num_of_bytes > 1000:
+            num_of_bytes = base
+        else:
+            return "%d B" % num_of_bytes
+    elif num_of_bytes < base and gnu:
+        if num_of_bytes > 1000:
+            num_of_bytes = base
+        else:
+            return "%dB" % num_of_bytes
+
+    for i, s in enumerate(suffix):
+        unit = base ** (i + 2)
+        if len(str(int(base * num_of_bytes / unit))) == 4 and num_of_bytes < unit:
+            num_of_bytes = unit
+        if num_of_bytes < unit:
+            break
+    if gnu:
+        return (num_format + "%s") % ((base * num_of_bytes / unit), s)
+    return (num_format + " %s") % ((base * num_of_bytes / unit), s)
+
+
+def sizes():
+    """Sizes around each unit boundary and a spread of random sizes."""
+    values = [0, 1, 2, 999, 1000, 1001, 1023, 1024, 1025, 0.5, 1.5, 999.9]
+    for base in (1000, 1024):
+        for power in range(1, 9):
+            unit = base**power
+            values.extend(
+                [unit - 1, unit, unit + 1, unit * 999.94, unit * 999.96, unit * 1023.9]
+            )
+    rand = random.Random(0)
+    values.extend(rand.randrange(10 ** rand.randrange(1, 20)) for _ in range(2000))
+    return values
+
+
+def durations():
+    values = [0, 1, 59, 60, 61, 3599, 3600, 3601, 86399, 86400, 86401, 8640000]
+    values.extend([SECS_INFINITY - 1, SECS_INFINITY, SECS_INFINITY + 1, 12.7, -1])
+    rand = random.Random(0)
+    values.extend(rand.randrange(-(10**5), 10**7) for _ in range(2000))
+    return values
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{}, dict(binary=True), dict(gnu=True), dict(num_format="%.2f")]
+)
+def test_natural_file_size_matches_original(kwargs):
+    for value in sizes():
+        assert natural_file_size(value, **kwargs) == original_natural_file_size(
+            value, **kwargs
+        ), value
+
+
+def test_natural_file_sizes_matches_natural_file_size():
+    values = sizes()
+    assert natural_file_sizes(values, gnu=True) == [
+        natural_file_size(v, gnu=True) for v in values
+    ]
+
+
+@pytest.mark.parametrize("spaces", [False, True])
+def test_pretty_time_delta_matches_original(spaces):
+    for value in durations():
+        assert pretty_time_delta(value, spaces) == original_pretty_time_delta(
+            value, spaces
+        ), value
+
+
+def test_format_eta_matches_original():
+    for value in durations():
+        assert format_eta(value) == original_format_eta(value), value
+
+
+def test_formatter_examples():
+    assert natural_file_size(1536, gnu=True) == "1.5K"
+    assert natural_file_size(10**9) == "1.0 GB"
+    assert pretty_time_delta(3725, spaces=True) == "1h 2m"
+    assert format_eta(3725) == "ETA  1h"
+    assert format_eta(SECS_INFINITY) == f"ETA   {INFINITY}"
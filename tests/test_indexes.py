@@ -0,0 +1,110 @@
+from qbittorrentui.indexes import FacetIndex, MaxMultiset, TextSearch
+
+
+def test_max_multiset_tracks_largest_value():
+    lengths = MaxMultiset([3, 5, 5, 1])
+    assert lengths.max() == 5
+
+    lengths.remove(5)
+    assert lengths.max() == 5
+    lengths.remove(5)
+    assert lengths.max() == 3
+
+    lengths.add(7)
+    assert lengths.max() == 7
+
+
+def test_max_multiset_replace():
+    lengths = MaxMultiset([2, 9])
+    lengths.replace(9, 4)
+    assert lengths.max() == 4
+
+    lengths.replace(4, 4)
+    assert lengths.max() == 4
+
+
+def test_max_multiset_empty():
+    lengths = MaxMultiset()
+    assert lengths.max() is None
+    assert lengths.max(default=10) == 10
+
+    lengths.add(0)
+    assert lengths.max(default=10) == 0
+
+    lengths.remove(0)
+    # removing a value that isn't in the set is ignored
+    lengths.remove(3)
+    assert lengths.max(default=10) == 10
+
+    lengths.add(2)
+    lengths.clear()
+    assert lengths.max() is None
+
+
+def test_text_search_is_case_insensitive():
+    search = TextSearch()
+    search.set("a", "Ubuntu 24.04 Desktop")
+    search.set("b", "debian netinst")
+
+    assert search.search("UBUNTU") == {"a"}
+    assert "a" in search
+    assert "b" not in search
+
+
+def test_text_search_narrows_and_widens():
+    search = TextSearch()
+    for key, text in dict(a="ubuntu server", b="ubuntu desktop", c="fedora").items():
+        search.set(key, text)
+
+    assert search.search("u") == {"a", "b"}
+    assert search.search("ubuntu d") == {"b"}
+    # a query that doesn't contain the previous query scans every text again
+    assert search.search("ubuntu") == {"a", "b"}
+    assert search.search("") == set()
+    assert "c" in search
+
+
+def test_text_search_keeps_matches_up_to_date():
+    search = TextSearch()
+    search.set("a", "ubuntu")
+    search.search("ubuntu")
+
+    search.set("b", "Ubuntu Server")
+    assert search.matches == {"a", "b"}
+
+    search.set("a", "renamed")
+    assert search.matches == {"b"}
+
+    search.remove("b")
+    assert search.matches == set()
+    assert search.search("ren") == {"a"}
+
+    search.clear()
+    assert search.search("ren") == set()
+
+
+def test_facet_index_members_and_counts():
+    tags = FacetIndex()
+    tags.set("a", ["linux", "iso"])
+    tags.set("b", ["linux"])
+
+    assert tags.members("linux") == {"a", "b"}
+    assert tags.members("iso") == {"a"}
+    assert tags.members("missing") == frozenset()
+    assert tags.counts() == {"linux": 2, "iso": 1}
+
+
+def test_facet_index_moves_keys_between_values():
+    tags = FacetIndex()
+    tags.set("a", ["linux", "iso"])
+    tags.set("a", ["iso", "new"])
+
+    assert tags.members("linux") == frozenset()
+    assert tags.counts() == {"iso": 1, "new": 1}
+
+    tags.remove("a")
+    assert tags.counts() == {}
+
+    tags.set("b", ["x"])
+    tags.clear()
+    assert tags.members("x") == frozenset()
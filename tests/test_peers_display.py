@@ -0,0 +1,119 @@
+import pytest
+
+from qbittorrentui.windows.torrent import PeersDisplay
+
+
+def peer(i, **data):
+    return dict(
+        dict(
+            client=f"client {i % 3}",
+            connection="BT",
+            country_code="ca",
+            dl_speed=i * 10,
+            downloaded=0,
+            files="",
+            flags="D",
+            ip=f"10.0.0.{i}",
+            port=1000 + i,
+            progress=i / 100,
+            relevance=1 - i / 100,
+            up_speed=(i % 4) * 10,
+            uploaded=0,
+        ),
+        **data,
+    )
+
+
+@pytest.fixture
+def peers_display():
+    peers_display = PeersDisplay()
+    peers_display.page_size = 4
+    peers_display.update(
+        "test",
+        sync_torrent_peers=dict(
+            full_update=True, peers={f"p{i}": peer(i) for i in range(10)}
+        ),
+    )
+    return peers_display
+
+
+def displayed_peers(peers_display):
+    rows = {w: key for key, w in peers_display.peer_rows.items()}
+    return [rows[w] for w in peers_display.walker[3:]]
+
+
+def test_first_page_is_sorted_by_download_speed(peers_display):
+    assert displayed_peers(peers_display) == ["p9", "p8", "p7", "p6"]
+    assert set(peers_display.peer_rows) == {"p9", "p8", "p7", "p6"}
+    assert peers_display.status_w.text.startswith("Peers 1-4 of 10")
+
+
+def test_pages(peers_display):
+    peers_display.change_page(1)
+    assert displayed_peers(peers_display) == ["p5", "p4", "p3", "p2"]
+
+    peers_display.change_page(1)
+    assert displayed_peers(peers_display) == ["p1", "p0"]
+    assert peers_display.status_w.text.startswith("Peers 9-10 of 10")
+
+    # there isn't a page after the last page or before the first page
+    peers_display.change_page(1)
+    assert peers_display.page == 2
+    peers_display.change_page(-5)
+    assert peers_display.page == 0
+
+
+@pytest.mark.parametrize(
+    "column, descending, expected",
+    [
+        ("progress", False, ["p0", "p1", "p2", "p3"]),
+        ("relevance", True, ["p0", "p1", "p2", "p3"]),
+        ("up_speed", True, ["p7", "p3", "p6", "p2"]),
+        ("client", False, ["p0", "p3", "p6", "p9"]),
+        (None, False, ["p0", "p1", "p2", "p3"]),
+    ],
+)
+def test_sort(peers_display, column, descending, expected):
+    peers_display.change_page(1)
+    peers_display.set_sort(column, descending=descending)
+
+    assert peers_display.page == 0
+    assert displayed_peers(peers_display) == expected
+
+
+def test_page_matches_a_full_sort(peers_display):
+    peers = {f"p{i}": peer(i, dl_speed=(i * 37) % 101) for i in range(100)}
+    peers_display.update("test", sync_torrent_peers=dict(full_update=True, peers=peers))
+    peers_display.change_page(3)
+
+    ordered = sorted(peers, key=lambda k: (peers[k]["dl_speed"], k), reverse=True)
+    assert peers_display.page_peer_keys() == ordered[12:16]
+    assert displayed_peers(peers_display) == ordered[12:16]
+
+
+def test_page_is_clamped_after_removals(peers_display):
+    peers_display.change_page(2)
+    peers_display.update(
+        "test", sync_torrent_peers=dict(peers_removed=["p0", "p1", "p2"])
+    )
+
+    assert peers_display.page == 1
+    assert displayed_peers(peers_display) == ["p5", "p4", "p3"]
+    assert set(peers_display.peer_rows) == {"p5", "p4", "p3"}
+
+
+def test_changes_move_peers_between_pages(peers_display):
+    peers_display.update(
+        "test",
+        sync_torrent_peers=dict(
+            peers={"p0": {"dl_speed": 1000, "client": "a much longer client"}}
+        ),
+    )
+
+    assert displayed_peers(peers_display) == ["p0", "p9", "p8", "p7"]
+    assert "p6" not in peers_display.peer_rows
+    assert peers_display.widths["client"] == len("a much longer client")
+
+    # column widths only fit the peers on the page
+    peers_display.change_page(1)
+    assert peers_display.widths["client"] == len("client 0")
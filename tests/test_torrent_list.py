@@ -0,0 +1,157 @@
+from types import SimpleNamespace
+
+import pytest
+
+from qbittorrentui.events import server_torrents_changed
+from qbittorrentui.misc_widgets import ButtonWithoutCursor
+from qbittorrentui.windows.torrent_list import TorrentFacetDialog, TorrentList
+
+
+class TorrentListBox:
+    width = 200
+    main = None
+    client = None
+
+    def update_status_text(self):
+        pass
+
+
+def torrent(i, **data):
+    return dict(
+        dict(
+            name=f"torrent {i}",
+            state="downloading",
+            size=1000,
+            progress=0.5,
+            dlspeed=i * 1000,
+            upspeed=0,
+            added_on=i,
+            category="",
+            tags="",
+            tracker="",
+        ),
+        **data,
+    )
+
+
+@pytest.fixture
+def torrent_list():
+    torrent_list = TorrentList(TorrentListBox())
+    torrent_list.update(
+        torrents={f"h{i}": torrent(i) for i in range(10)},
+        torrents_removed={},
+        full_update=True,
+    )
+    torrent_list.apply_torrent_list_filter("all")
+    torrent_list.set_torrent_list_focus("test", "h5")
+    return torrent_list
+
+
+def focused_row_hash(torrent_list):
+    row_w, _ = torrent_list.body.get_focus()
+    return row_w.base_widget.get_torrent_hash()
+
+
+def test_focus_stays_on_torrent_when_torrents_above_are_removed(torrent_list):
+    torrent_list.update(torrents={}, torrents_removed=["h1", "h2"])
+
+    assert torrent_list.get_torrent_hash_for_focused_row() == "h5"
+    assert focused_row_hash(torrent_list) == "h5"
+    assert torrent_list.body.get_focus()[1] == 3
+
+
+def test_focus_stays_on_torrent_when_torrents_are_added_or_resorted(torrent_list):
+    torrent_list.set_sort("dlspeed", descending=True)
+    assert focused_row_hash(torrent_list) == "h5"
+
+    torrent_list.update(
+        torrents={"h10": torrent(10), "h0": {"dlspeed": 10**9}},
+        torrents_removed={},
+    )
+    assert focused_row_hash(torrent_list) == "h5"
+    assert torrent_list.body.get_focus()[1] == 6
+
+
+def test_focus_moves_to_the_torrent_in_place_of_a_removed_torrent(torrent_list):
+    torrent_list.update(torrents={}, torrents_removed=["h5"])
+
+    assert torrent_list.get_torrent_hash_for_focused_row() == "h6"
+    assert focused_row_hash(torrent_list) == "h6"
+
+
+def test_set_focus_by_hash(torrent_list):
+    torrent_list.set_torrent_list_focus("test", "h8")
+    assert torrent_list.walker.focus_hash == "h8"
+    assert torrent_list.body.get_focus()[1] == 8
+
+    # torrents that aren't in the list focus the first torrent
+    torrent_list.set_torrent_list_focus("test", "missing")
+    assert focused_row_hash(torrent_list) == "h0"
+
+
+def test_focus_survives_switching_tabs(torrent_list):
+    torrent_list.update(torrents={"h2": {"state": "pausedUP"}}, torrents_removed={})
+    torrent_list.apply_torrent_list_filter("downloading")
+    assert focused_row_hash(torrent_list) == "h5"
+    assert torrent_list.body.get_focus()[1] == 4
+
+
+def test_focus_moves_in_place_of_a_removed_torrent_before_refreshing(torrent_list):
+    torrent_list.update(torrents={}, torrents_removed=["h1", "h2", "h5"])
+
+    # the refresh may be deferred; the focus is already on the right torrent
+    assert focused_row_hash(torrent_list) == "h6"
+    assert torrent_list.body.get_focus()[1] == 3
+
+
+def test_focus_moves_in_place_of_a_torrent_that_left_the_tab(torrent_list):
+    torrent_list.apply_torrent_list_filter("downloading")
+    torrent_list.update(
+        torrents={"h3": {"state": "pausedUP"}, "h5": {"state": "pausedUP"}},
+        torrents_removed={},
+    )
+
+    assert focused_row_hash(torrent_list) == "h6"
+
+
+def test_small_eta_changes_re_sort(torrent_list):
+    torrent_list.update(
+        torrents={f"h{i}": {"eta": 100 + i * 10} for i in range(10)},
+        torrents_removed={},
+    )
+    torrent_list.set_sort("eta")
+    assert torrent_list.walker.hashes[:2] == ["h0", "h1"]
+
+    # 30 seconds is well beyond the hysteresis for a 3 minute ETA
+    torrent_list.update(torrents={"h9": {"eta": 160}}, torrents_removed={})
+    assert torrent_list.walker.hashes[6:8] == ["h6", "h9"]
+
+    # but a second isn't
+    torrent_list.update(torrents={"h0": {"eta": 101}}, torrents_removed={})
+    assert torrent_list.walker.hashes[0] == "h0"
+    torrent_list.update(torrents={"h0": {"eta": 115}}, torrents_removed={})
+    assert torrent_list.walker.hashes[:2] == ["h1", "h0"]
+
+
+def test_facet_dialog_counts_follow_torrent_changes(torrent_list):
+    main = SimpleNamespace(server=SimpleNamespace(categories={"linux": {}}))
+    dialog = TorrentFacetDialog(SimpleNamespace(main=main, torrent_list_w=torrent_list))
+
+    def labels():
+        return [
+            w.base_widget.label
+            for w in dialog.body
+            if isinstance(w.base_widget, ButtonWithoutCursor)
+        ]
+
+    assert "linux (0)" in labels()
+    dialog.body.set_focus(labels().index("linux (0)") + 2)
+
+    changes = {"h1": {"category": "linux"}, "h2": {"category": "linux"}}
+    torrent_list.update(torrents=changes, torrents_removed={})
+    server_torrents_changed.send("test", torrents=changes, torrents_removed={})
+    dialog.render((40, 30), focus=True)
+
+    assert "linux (2)" in labels()
+    assert "linux (0)" not in labels()
+    assert dialog.focus.base_widget.label == "linux (2)"